@@ -72,6 +72,11 @@ class DownloadCog(commands.Cog):
             feature_flags=self.feature_flags, download_dir=self.download_dir
         )
 
+    async def cog_unload(self) -> None:
+        """Close clients held open by the download strategies."""
+        for strategy in self.strategies.values():
+            await strategy.aclose()
+
     def _get_strategy_for_url(self, url: str) -> BaseDownloadStrategy | None:
         """Get the appropriate strategy for a URL.
 
@@ -1,6 +1,22 @@
 """CLI commands for boss-bot."""
 
-from .assistants import app as assistants_app
-from .download import app as download_app
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .assistants import app as assistants_app
+    from .download import app as download_app
 
 __all__ = ["download_app", "assistants_app"]
+
+# Exported app name -> submodule; each command module is imported on first access
+_APPS = {"download_app": ".download", "assistants_app": ".assistants"}
+
+
+def __getattr__(name: str):
+    """Import a command module's Typer app on first access."""
+    if name in _APPS:
+        return import_module(_APPS[name], __name__).app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
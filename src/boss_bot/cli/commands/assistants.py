@@ -19,6 +19,7 @@ from boss_bot.ai.assistants import (
     sync_assistants_from_directory,
 )
 from boss_bot.ai.assistants.models import AssistantConfig, create_default_assistant_config
+from boss_bot.cli.utils.runner import loop_factory
 from boss_bot.core.env import BossSettings
 
 # Create a sub-application for assistant commands
@@ -104,7 +105,7 @@ def list(
             console.print(f"[red]Error listing assistants: {e}[/red]")
             raise typer.Exit(1)
 
-    asyncio.run(_list_assistants())
+    asyncio.run(_list_assistants(), loop_factory=loop_factory())
 
 
 @app.command()
@@ -161,7 +162,7 @@ def sync_from(
             console.print(f"[red]Error during synchronization: {e}[/red]")
             raise typer.Exit(1)
 
-    asyncio.run(_sync_from_yaml())
+    asyncio.run(_sync_from_yaml(), loop_factory=loop_factory())
 
 
 @app.command()
@@ -210,7 +211,7 @@ def sync_to(
             console.print(f"[red]Error during export: {e}[/red]")
             raise typer.Exit(1)
 
-    asyncio.run(_sync_to_yaml())
+    asyncio.run(_sync_to_yaml(), loop_factory=loop_factory())
 
 
 @app.command()
@@ -259,7 +260,7 @@ def health(
             console.print(f"[red]Health check failed: {e}[/red]")
             raise typer.Exit(1)
 
-    asyncio.run(_health_check())
+    asyncio.run(_health_check(), loop_factory=loop_factory())
 
 
 @app.command()
@@ -352,4 +353,4 @@ def graphs(
             console.print(f"[red]Error listing graphs: {e}[/red]")
             raise typer.Exit(1)
 
-    asyncio.run(_list_graphs())
+    asyncio.run(_list_graphs(), loop_factory=loop_factory())
@@ -3,22 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import importlib
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from itertools import zip_longest
 from pathlib import Path
-from typing import Annotated, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Annotated, Any, Optional
+from urllib.parse import urlsplit
 
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.console import Console, Group
+from rich.table import Table
+from rich.text import Text
 
+from boss_bot.cli.utils.runner import run as _run
 from boss_bot.core.downloads.feature_flags import DownloadFeatureFlags
-from boss_bot.core.downloads.strategies import (
-    InstagramDownloadStrategy,
-    RedditDownloadStrategy,
-    TwitterDownloadStrategy,
-    YouTubeDownloadStrategy,
-)
 from boss_bot.core.env import BossSettings
 
+if TYPE_CHECKING:
+    from boss_bot.core.downloads.handlers.base_handler import MediaMetadata
+    from boss_bot.core.downloads.strategies import BaseDownloadStrategy
+
 # AI agent imports (optional)
 try:
     from boss_bot.ai.agents.content_analyzer import ContentAnalyzer
@@ -29,31 +44,62 @@ try:
 except ImportError:
     AI_AGENTS_AVAILABLE = False
 
-# Create a sub-application for download commands
-app = typer.Typer(name="download", help="Download content from various platforms", no_args_is_help=True)
+# Faster JSON serialization (optional)
+try:
+    import orjson
 
-console = Console()
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+# Create a sub-application for download commands
+app = typer.Typer(name="download", help="Download content from various platforms", no_args_is_help=True)
 
-# Initialize settings and feature flags lazily to avoid test collection issues
-_settings = None
-_feature_flags = None
+console = Console(highlight=False, log_time=False)
 
 
+# Settings and feature flags are created on first use to avoid test collection issues
+@functools.cache
 def get_settings() -> BossSettings:
     """Get or create settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = BossSettings()
-    return _settings
+    return BossSettings()
 
 
+@functools.cache
 def get_feature_flags() -> DownloadFeatureFlags:
     """Get or create feature flags instance."""
-    global _feature_flags
-    if _feature_flags is None:
-        _feature_flags = DownloadFeatureFlags(get_settings())
-    return _feature_flags
+    return DownloadFeatureFlags(get_settings())
+
+
+@functools.lru_cache(maxsize=1)
+def _strategy_info(feature_flags: DownloadFeatureFlags) -> dict[str, bool]:
+    """Get strategy info once per feature flags instance for the life of the CLI process.
+
+    Call ``_strategy_info.cache_clear()`` if the underlying settings are mutated at runtime.
+
+    Args:
+        feature_flags: Feature flags to read
+
+    Returns:
+        Dictionary with current feature flag states (treat as read-only)
+    """
+    return feature_flags.get_strategy_info()
+
+
+def _api_enabled(platform: str) -> bool:
+    """Check whether API-direct mode is enabled for a platform, using the memoized strategy info.
+
+    Args:
+        platform: Platform name (twitter, reddit, instagram, youtube)
+
+    Returns:
+        True if API-direct mode is enabled for the platform
+    """
+    return bool(_strategy_info(get_feature_flags()).get(f"{platform}_api"))
+
+
+# Strategy banner shown before a download, keyed by whether API-direct mode is enabled
+_API_BANNERS = {True: "🚀 Using experimental API-direct approach", False: "🖥️ Using CLI-based approach"}
 
 
 # Initialize AI agents lazily to avoid test collection issues
@@ -67,8 +113,6 @@ def get_strategy_selector_agent():
     if _strategy_selector_agent is None and AI_AGENTS_AVAILABLE and get_feature_flags().ai_strategy_selection_enabled:
         try:
             # Create a simple mock model for now (will be replaced with actual LLM)
-            from types import SimpleNamespace
-
             mock_model = SimpleNamespace()
             mock_model.invoke = lambda x: {"content": "AI response"}
 
@@ -88,8 +132,6 @@ def get_content_analyzer_agent():
     if _content_analyzer_agent is None and AI_AGENTS_AVAILABLE and get_feature_flags().ai_content_analysis_enabled:
         try:
             # Create a simple mock model for now (will be replaced with actual LLM)
-            from types import SimpleNamespace
-
             mock_model = SimpleNamespace()
             mock_model.invoke = lambda x: {"content": "AI analysis"}
 
@@ -101,6 +143,308 @@ def get_content_analyzer_agent():
     return _content_analyzer_agent
 
 
+# Keep Rich's internal segment list bounded when listing very large galleries
+_FILE_LIST_BATCH_SIZE = 1000
+
+
+def _print_file_list(files: list[str]) -> None:
+    """Print downloaded file paths in batched writes instead of one print per file.
+
+    Args:
+        files: Paths of the downloaded files
+    """
+    for start in range(0, len(files), _FILE_LIST_BATCH_SIZE):
+        batch = files[start : start + _FILE_LIST_BATCH_SIZE]
+        console.print("\n".join(f"  📄 {file_path}" for file_path in batch))
+
+
+# Raw metadata larger than this is written to a temp file instead of the terminal
+_MAX_INLINE_JSON_BYTES = 64_000
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize metadata to indented JSON bytes, using orjson when installed.
+
+    Args:
+        data: JSON-serializable metadata; unknown types are converted with ``str``
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        # Non-string keys are stringified like the stdlib encoder does instead of raising
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+def _print_raw_json(data: Any) -> None:
+    """Print raw metadata as indented JSON.
+
+    Payloads larger than ``_MAX_INLINE_JSON_BYTES`` (e.g. YouTube playlists) are
+    written to a temporary file and only its path is printed. When stdout is piped,
+    the serialized bytes are written straight to the underlying buffer, skipping the
+    str round-trip and Rich rendering.
+
+    Args:
+        data: JSON-serializable metadata to print
+    """
+    # Serialize once; the size check, file dump and terminal output all share it
+    payload = _dumps(data)
+    if len(payload) > _MAX_INLINE_JSON_BYTES:
+        fd, name = tempfile.mkstemp(prefix="boss-bot-metadata-", suffix=".json")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        console.print(f"Raw metadata ({len(payload):,} bytes) written to {name}")
+        return
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None and not sys.stdout.isatty():
+        sys.stdout.flush()
+        buffer.write(payload + b"\n")
+        buffer.flush()
+        return
+    console.print(payload.decode(), markup=False, highlight=False)
+
+
+def _supports_streaming(strategy) -> bool:
+    """Check whether a strategy streams files instead of using the download() fallback."""
+    from boss_bot.core.downloads.strategies import BaseDownloadStrategy
+
+    return (
+        isinstance(strategy, BaseDownloadStrategy)
+        and type(strategy).download_iter is not BaseDownloadStrategy.download_iter
+    )
+
+
+class _PartialDownloadError(RuntimeError):
+    """A streamed download failed after some of its files were already printed; never retried."""
+
+
+async def _download_content(strategy, url: str, options: dict) -> tuple[MediaMetadata, bool]:
+    """Download content, printing files as they arrive when the strategy supports streaming.
+
+    Args:
+        strategy: Download strategy to use
+        url: URL to download
+        options: Additional download options
+
+    Returns:
+        Tuple of (metadata, streamed) where streamed is True if files were already printed
+
+    Raises:
+        _PartialDownloadError: If a streamed download fails after printing some files
+    """
+    if not _supports_streaming(strategy):
+        return await strategy.download(url, **options), False
+
+    metadata = None
+    try:
+        async for file_path, metadata in strategy.download_iter(url, **options):
+            console.print(f"  📄 {file_path}")
+    except Exception as e:
+        if metadata is None:
+            raise
+        raise _PartialDownloadError(str(e)) from e
+
+    if metadata is None:
+        from boss_bot.core.downloads.handlers.base_handler import MediaMetadata
+
+        metadata = MediaMetadata(url=url, platform=strategy.platform_name, error=f"No content downloaded from {url}")
+        return metadata, False
+    return metadata, True
+
+
+# Download directories already created by this process
+_DIR_CREATED: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a download directory once per process, skipping the mkdir on repeat calls.
+
+    Args:
+        path: Directory to create
+    """
+    if path in _DIR_CREATED:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _DIR_CREATED.add(path)
+
+
+# Upper bound on concurrent requests when several URLs are passed to one command
+_MAX_CONCURRENT_DOWNLOADS = 8
+
+
+async def _gather_bounded(
+    func: Callable[[str], Awaitable[Any]], urls: list[str], concurrency: int | None = None
+) -> list[Any]:
+    """Run ``func`` for every URL concurrently, with a bounded number in flight.
+
+    URLs are started round-robin across hosts. Failures are returned in place of results
+    so one bad URL does not cancel the others.
+
+    Args:
+        func: Coroutine function called with each URL
+        urls: URLs to process
+        concurrency: Maximum URLs in flight, defaults to ``min(_MAX_CONCURRENT_DOWNLOADS, len(urls))``
+
+    Returns:
+        Results (or raised exceptions) in the same order as ``urls``
+    """
+    semaphore = asyncio.Semaphore(concurrency or min(_MAX_CONCURRENT_DOWNLOADS, len(urls)) or 1)
+
+    async def run_one(url: str) -> Any:
+        async with semaphore:
+            try:
+                return await func(url)
+            except Exception as e:
+                return e
+
+    # Semaphore waiters are woken in creation order, so create tasks round-robin
+    # across hosts: a batch mixing sites does not queue one host's URLs behind another's
+    by_host: dict[str, list[int]] = defaultdict(list)
+    for index, url in enumerate(urls):
+        by_host[urlsplit(url).netloc.lower()].append(index)
+    order = [index for group in zip_longest(*by_host.values()) for index in group if index is not None]
+
+    tasks: dict[int, asyncio.Task] = {}
+    async with asyncio.TaskGroup() as tg:
+        for index in order:
+            tasks[index] = tg.create_task(run_one(urls[index]))
+    return [tasks[index].result() for index in range(len(urls))]
+
+
+async def _run_batch(
+    strategy, platform: str, func: Callable[[str], Awaitable[Any]], urls: list[str], concurrency: int | None = None
+) -> list[Any]:
+    """Run a multi-URL batch, keeping one gallery-dl API client open across all URLs.
+
+    In API-direct mode the strategy's AsyncGalleryDL client is entered once for the
+    whole batch, so its executor and loaded configuration are shared instead of being
+    rebuilt per URL. CLI mode and yt-dlp strategies run the batch unchanged.
+
+    Args:
+        strategy: Download strategy to use
+        platform: Platform key used for feature flag lookups
+        func: Coroutine function called with each URL
+        urls: URLs to process
+        concurrency: Maximum URLs in flight, see ``_gather_bounded``
+
+    Returns:
+        Results (or raised exceptions) in the same order as ``urls``
+    """
+    if len(urls) > 1 and _api_enabled(platform):
+        from boss_bot.core.downloads.clients import AsyncGalleryDL
+
+        api_client = getattr(strategy, "api_client", None)
+        if isinstance(api_client, AsyncGalleryDL):
+            async with api_client:
+                return await _gather_bounded(func, urls, concurrency)
+    return await _gather_bounded(func, urls, concurrency)
+
+
+# Retries for rate-limited URLs, and the cap on a single backoff (one rate-limit window)
+_DEFAULT_RETRIES = 2
+_MAX_BACKOFF_SECONDS = 900
+_RATE_LIMITED_RE = re.compile(r"\b429\b|rate.?limit|too many requests", re.IGNORECASE)
+
+
+class _RateLimiter:
+    """Async context manager that spaces request starts to at most ``rate`` per second."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._next_start = 0.0
+
+    async def __aenter__(self) -> None:
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+def _is_rate_limited(result: Any) -> bool:
+    """Check whether a download/metadata result or exception reports a rate limit."""
+    if isinstance(result, Exception):
+        return bool(_RATE_LIMITED_RE.search(str(result)))
+    metadata = result[0] if isinstance(result, tuple) else result
+    error = getattr(metadata, "error", None)
+    return isinstance(error, str) and bool(_RATE_LIMITED_RE.search(error))
+
+
+def _retryable(outcome: Any) -> bool:
+    """Check whether an attempt's result or exception should be retried.
+
+    Rate-limited attempts are retried unless they already printed downloaded files,
+    since running them again would print those files a second time.
+    """
+    if isinstance(outcome, _PartialDownloadError) or (isinstance(outcome, tuple) and outcome[1] is True):
+        return False
+    return _is_rate_limited(outcome)
+
+
+async def _retrying(call: Callable[[], Awaitable[Any]], retries: int, limiter) -> Any:
+    """Run ``call`` under the rate limiter, retrying rate-limit failures with exponential backoff.
+
+    Args:
+        call: Zero-argument coroutine function performing one request
+        retries: Maximum number of retries after the first attempt
+        limiter: Async context manager entered before each attempt
+
+    Returns:
+        The result of the last attempt
+
+    Raises:
+        Exception: The last attempt's exception, if it raised
+    """
+    for attempt in range(retries + 1):
+        async with limiter:
+            try:
+                result = await call()
+            except Exception as e:
+                if attempt == retries or not _retryable(e):
+                    raise
+            else:
+                if attempt == retries or not _retryable(result):
+                    return result
+        delay = min(_MAX_BACKOFF_SECONDS, 2 ** (attempt + 1)) + random.random()
+        console.print(f"[yellow]⏳ Rate limited, retrying in {delay:.0f}s ({attempt + 1}/{retries})[/yellow]")
+        await asyncio.sleep(delay)
+
+
+# Strategy class name per platform; the strategies package is imported on first use
+_STRATEGY_CLASSES: dict[str, str] = {
+    "twitter": "TwitterDownloadStrategy",
+    "reddit": "RedditDownloadStrategy",
+    "instagram": "InstagramDownloadStrategy",
+    "youtube": "YouTubeDownloadStrategy",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _get_strategy(
+    platform: str, download_dir: Path, feature_flags: DownloadFeatureFlags
+) -> BaseDownloadStrategy | None:
+    """Build a strategy once per (platform, download_dir, feature_flags) for the life of the CLI process.
+
+    Args:
+        platform: Platform name (twitter, reddit, instagram, youtube)
+        download_dir: Directory for downloads
+        feature_flags: Feature flags the strategy should use
+
+    Returns:
+        Strategy instance for the platform, or None if the platform is unknown
+    """
+    class_name = _STRATEGY_CLASSES.get(platform)
+    if class_name is None:
+        return None
+    strategy_cls = getattr(importlib.import_module("boss_bot.core.downloads.strategies"), class_name)
+    return strategy_cls(feature_flags=feature_flags, download_dir=download_dir)
+
+
 def get_strategy_for_platform(platform: str, download_dir: Path):
     """Get the appropriate strategy for a platform.
 
@@ -111,14 +455,7 @@ def get_strategy_for_platform(platform: str, download_dir: Path):
     Returns:
         Strategy instance for the platform
     """
-    feature_flags = get_feature_flags()
-    strategies = {
-        "twitter": TwitterDownloadStrategy(feature_flags=feature_flags, download_dir=download_dir),
-        "reddit": RedditDownloadStrategy(feature_flags=feature_flags, download_dir=download_dir),
-        "instagram": InstagramDownloadStrategy(feature_flags=feature_flags, download_dir=download_dir),
-        "youtube": YouTubeDownloadStrategy(feature_flags=feature_flags, download_dir=download_dir),
-    }
-    return strategies.get(platform)
+    return _get_strategy(platform, download_dir, get_feature_flags())
 
 
 async def get_ai_enhanced_strategy(url: str, download_dir: Path) -> tuple:
@@ -138,7 +475,7 @@ async def get_ai_enhanced_strategy(url: str, download_dir: Path) -> tuple:
     if strategy_selector_agent:
         try:
             # Create agent context
-            agent_context = AgentContext(request_id=f"cli_{asyncio.get_event_loop().time()}", user_id="cli_user")
+            agent_context = AgentContext(request_id=f"cli_{asyncio.get_running_loop().time()}", user_id="cli_user")
 
             # Create agent request
             request = AgentRequest(
@@ -166,46 +503,107 @@ async def get_ai_enhanced_strategy(url: str, download_dir: Path) -> tuple:
             console.print(f"[yellow]AI strategy selection failed: {e}, using traditional method[/yellow]")
 
     # Fall back to traditional method
-    feature_flags = get_feature_flags()
-    all_strategies = {
-        "twitter": TwitterDownloadStrategy(feature_flags=feature_flags, download_dir=download_dir),
-        "reddit": RedditDownloadStrategy(feature_flags=feature_flags, download_dir=download_dir),
-        "instagram": InstagramDownloadStrategy(feature_flags=feature_flags, download_dir=download_dir),
-        "youtube": YouTubeDownloadStrategy(feature_flags=feature_flags, download_dir=download_dir),
-    }
-
-    for platform, strategy in all_strategies.items():
-        if strategy.supports_url(url):
+    for platform in _STRATEGY_CLASSES:
+        strategy = get_strategy_for_platform(platform, download_dir)
+        if strategy and strategy.supports_url(url):
             return strategy, ai_metadata
 
     return None, ai_metadata
 
 
-def validate_twitter_url(url: str) -> str:
-    """Validate that the URL is a Twitter/X URL.
+# URL patterns per platform, mirroring each handler's supports_url() rules
+_URL_PATTERNS: dict[str, re.Pattern[str]] = {
+    "twitter": re.compile(r"(?:twitter|x)\.com/[^/]+(?:/status/\d+|$)", re.IGNORECASE),
+    "reddit": re.compile(r"^https?://(?:www\.|old\.)?reddit\.com/r/[\w\d_]+/comments/[\w\d]+/"),
+    "instagram": re.compile(
+        r"^https?://(?:www\.)?instagram\.com/(?:p/[\w-]+|reel/[\w-]+|tv/[\w-]+|stories/[\w.-]+/\d+|[\w.-]+)/?",
+        re.IGNORECASE,
+    ),
+    "youtube": re.compile(
+        r"^https?://(?:"
+        r"(?:www\.|music\.)?youtube\.com/watch\?v=[\w-]+"
+        r"|(?:www\.)?youtube\.com/(?:embed/|v/|shorts/|playlist\?list=|channel/|user/|c/|@)[\w-]+"
+        r"|youtu\.be/[\w-]+"
+        r")",
+        re.IGNORECASE,
+    ),
+}
+
+
+# Scheme/host prefixes every matching URL must start with, checked before the regex to
+# reject other platforms' URLs cheaply. Twitter is omitted because its pattern is unanchored.
+# Instagram and YouTube patterns are case-insensitive, so their prefixes are compared lowercased.
+_URL_PREFIXES: dict[str, tuple[str, ...]] = {
+    "reddit": tuple(f"{scheme}://{host}reddit.com/r/" for scheme in ("https", "http") for host in ("", "www.", "old.")),
+    "instagram": tuple(f"{scheme}://{host}instagram.com/" for scheme in ("https", "http") for host in ("", "www.")),
+    "youtube": tuple(
+        f"{scheme}://{host}"
+        for scheme in ("https", "http")
+        for host in ("youtube.com/", "www.youtube.com/", "music.youtube.com/", "youtu.be/")
+    ),
+}
+_CASE_SENSITIVE_PREFIXES = frozenset({"reddit"})
+
+# Substrings (lowercased) a URL must contain for platforms whose pattern can match anywhere
+_URL_MARKERS: dict[str, tuple[str, ...]] = {"twitter": ("twitter.com/", "x.com/")}
+
+
+def _validate_platform_url(platform: str, url: str, label: str, formats: tuple[str, ...]) -> str:
+    """Validate a URL against a platform's pattern without building a strategy.
 
     Args:
+        platform: Platform key in ``_URL_PATTERNS``
         url: URL to validate
+        label: Human readable platform name used in the error message
+        formats: Example URL formats listed in the error message
 
     Returns:
         Validated URL
 
     Raises:
-        typer.BadParameter: If URL is not a valid Twitter/X URL
+        typer.BadParameter: If URL does not match the platform pattern
     """
-    strategy = get_strategy_for_platform("twitter", Path.cwd())
-    if not strategy or not strategy.supports_url(url):
+    prefixes = _URL_PREFIXES.get(platform)
+    if prefixes is not None:
+        candidate = url if platform in _CASE_SENSITIVE_PREFIXES else url.lower()
+        matched = candidate.startswith(prefixes) and _URL_PATTERNS[platform].search(url)
+    else:
+        lowered = url.lower()
+        matched = any(marker in lowered for marker in _URL_MARKERS[platform]) and _URL_PATTERNS[platform].search(url)
+    if not matched:
         raise typer.BadParameter(
-            f"URL is not a valid Twitter/X URL: {url}\n"
-            "Supported formats:\n"
-            "  - https://twitter.com/username/status/123456789\n"
-            "  - https://x.com/username/status/123456789\n"
-            "  - https://twitter.com/username\n"
-            "  - https://x.com/username"
+            f"URL is not a valid {label} URL: {url}\nSupported formats:\n" + "\n".join(f"  - {f}" for f in formats)
         )
     return url
 
 
+@functools.lru_cache(maxsize=1024)
+def validate_twitter_url(url: str) -> str:
+    """Validate that the URL is a Twitter/X URL.
+
+    Args:
+        url: URL to validate
+
+    Returns:
+        Validated URL
+
+    Raises:
+        typer.BadParameter: If URL is not a valid Twitter/X URL
+    """
+    return _validate_platform_url(
+        "twitter",
+        url,
+        "Twitter/X",
+        (
+            "https://twitter.com/username/status/123456789",
+            "https://x.com/username/status/123456789",
+            "https://twitter.com/username",
+            "https://x.com/username",
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
 def validate_reddit_url(url: str) -> str:
     """Validate that the URL is a Reddit URL.
 
@@ -218,18 +616,19 @@ def validate_reddit_url(url: str) -> str:
     Raises:
         typer.BadParameter: If URL is not a valid Reddit URL
     """
-    strategy = get_strategy_for_platform("reddit", Path.cwd())
-    if not strategy or not strategy.supports_url(url):
-        raise typer.BadParameter(
-            f"URL is not a valid Reddit URL: {url}\n"
-            "Supported formats:\n"
-            "  - https://reddit.com/r/subreddit/comments/abc123/title/\n"
-            "  - https://www.reddit.com/r/subreddit/comments/abc123/title/\n"
-            "  - https://old.reddit.com/r/subreddit/comments/abc123/title/"
-        )
-    return url
-
-
+    return _validate_platform_url(
+        "reddit",
+        url,
+        "Reddit",
+        (
+            "https://reddit.com/r/subreddit/comments/abc123/title/",
+            "https://www.reddit.com/r/subreddit/comments/abc123/title/",
+            "https://old.reddit.com/r/subreddit/comments/abc123/title/",
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
 def validate_instagram_url(url: str) -> str:
     """Validate that the URL is an Instagram URL.
 
@@ -242,19 +641,20 @@ def validate_instagram_url(url: str) -> str:
     Raises:
         typer.BadParameter: If URL is not a valid Instagram URL
     """
-    strategy = get_strategy_for_platform("instagram", Path.cwd())
-    if not strategy or not strategy.supports_url(url):
-        raise typer.BadParameter(
-            f"URL is not a valid Instagram URL: {url}\n"
-            "Supported formats:\n"
-            "  - https://instagram.com/p/ABC123/\n"
-            "  - https://www.instagram.com/p/ABC123/\n"
-            "  - https://instagram.com/username/\n"
-            "  - https://www.instagram.com/username/"
-        )
-    return url
-
-
+    return _validate_platform_url(
+        "instagram",
+        url,
+        "Instagram",
+        (
+            "https://instagram.com/p/ABC123/",
+            "https://www.instagram.com/p/ABC123/",
+            "https://instagram.com/username/",
+            "https://www.instagram.com/username/",
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
 def validate_youtube_url(url: str) -> str:
     """Validate that the URL is a YouTube URL.
 
@@ -267,155 +667,478 @@ def validate_youtube_url(url: str) -> str:
     Raises:
         typer.BadParameter: If URL is not a valid YouTube URL
     """
-    strategy = get_strategy_for_platform("youtube", Path.cwd())
-    if not strategy or not strategy.supports_url(url):
-        raise typer.BadParameter(
-            f"URL is not a valid YouTube URL: {url}\n"
-            "Supported formats:\n"
-            "  - https://youtube.com/watch?v=VIDEO_ID\n"
-            "  - https://www.youtube.com/watch?v=VIDEO_ID\n"
-            "  - https://youtu.be/VIDEO_ID\n"
-            "  - https://youtube.com/playlist?list=PLAYLIST_ID"
-        )
-    return url
+    return _validate_platform_url(
+        "youtube",
+        url,
+        "YouTube",
+        (
+            "https://youtube.com/watch?v=VIDEO_ID",
+            "https://www.youtube.com/watch?v=VIDEO_ID",
+            "https://youtu.be/VIDEO_ID",
+            "https://youtube.com/playlist?list=PLAYLIST_ID",
+        ),
+    )
+
+
+def _raw(key: str, fmt: str = "{}") -> Callable[[MediaMetadata], Any]:
+    """Build a metadata field getter that reads and formats a key from ``raw_metadata``.
 
+    Args:
+        key: Key to read from ``raw_metadata``
+        fmt: Format string applied to the value when it is set
 
-@app.command("twitter")
-def download_twitter(
-    url: Annotated[str, typer.Argument(help="Twitter/X URL to download")],
-    output_dir: Annotated[Path | None, typer.Option("--output-dir", "-o", help="Directory to save downloads")] = None,
-    async_mode: Annotated[bool, typer.Option("--async", help="Use async download mode")] = False,
-    metadata_only: Annotated[
-        bool, typer.Option("--metadata-only", "-m", help="Extract metadata only, don't download files")
-    ] = False,
-    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Show verbose output")] = False,
-) -> None:
-    """Download Twitter/X content using strategy pattern.
-
-    Uses the experimental strategy pattern with feature flag support for API-direct or CLI modes.
-
-    Examples:
-        bossctl download twitter https://twitter.com/username/status/123456789
-        bossctl download twitter https://x.com/username/status/123456789 --output-dir ./downloads
-        bossctl download twitter https://twitter.com/username --metadata-only
+    Returns:
+        Getter returning the formatted value, or None when the key is missing or empty
     """
-    # Validate URL
-    url = validate_twitter_url(url)
-
-    # Setup download directory
-    download_dir = output_dir or Path.cwd() / ".downloads"
-    download_dir.mkdir(exist_ok=True, parents=True)
 
-    # Get strategy (with AI enhancement if available)
-    strategy, ai_metadata = asyncio.run(get_ai_enhanced_strategy(url, download_dir))
-    if not strategy:
-        console.print("[red]✗ Failed to initialize Twitter strategy[/red]")
-        raise typer.Exit(1)
+    def getter(metadata: MediaMetadata) -> str | None:
+        value = (metadata.raw_metadata or {}).get(key)
+        return fmt.format(value) if value else None
+
+    return getter
+
+
+# (label, getter) rows printed by --metadata-only, per platform and in display order
+_METADATA_FIELDS: dict[str, tuple[tuple[str, Callable[[MediaMetadata], Any]], ...]] = {
+    "twitter": (
+        ("Title", lambda m: m.title),
+        ("Author", lambda m: m.uploader),
+        ("Date", lambda m: m.upload_date),
+        ("Likes", lambda m: m.like_count),
+        ("Retweets", lambda m: m.view_count),
+    ),
+    "reddit": (
+        ("Title", lambda m: m.title),
+        ("Author", lambda m: m.uploader),
+        ("Subreddit", _raw("subreddit", "r/{}")),
+        ("Score", lambda m: m.like_count),
+        ("Comments", _raw("num_comments")),
+        ("Posted", lambda m: m.upload_date),
+    ),
+    "instagram": (
+        ("Title", lambda m: m.title),
+        ("Author", lambda m: m.uploader),
+        ("Posted", lambda m: m.upload_date),
+        ("Likes", lambda m: m.like_count),
+        ("Comments", _raw("comment_count")),
+        ("Description", _raw("description", "{:.100}...")),
+    ),
+    "youtube": (
+        ("Title", lambda m: m.title),
+        ("Channel", lambda m: m.uploader),
+        ("Upload Date", lambda m: m.upload_date),
+        ("Duration", lambda m: m.duration),
+        ("Views", lambda m: m.view_count),
+        ("Likes", lambda m: m.like_count),
+    ),
+}
+
+
+def _print_download_header(
+    label: str,
+    platform: str,
+    urls: list[str],
+    download_dir: Path,
+    async_mode: bool,
+    extra: dict[str, Any] | None = None,
+    ai_metadata: dict[str, Any] | None = None,
+    verbose: bool = False,
+) -> None:
+    """Print the banner shown before a platform download starts.
 
-    console.print("[blue]Twitter Download[/blue]")
-    console.print(f"URL: {url}")
-    console.print(f"Output Directory: {download_dir}")
-    console.print(f"Mode: {'Async' if async_mode else 'Sync'}")
+    Args:
+        label: Human readable platform name
+        platform: Platform key used for feature flag lookups
+        urls: URLs being downloaded
+        download_dir: Directory for downloads
+        async_mode: Whether async download mode was requested
+        extra: Additional ``name: value`` lines to show after the mode
+        ai_metadata: AI strategy selection details, if AI picked the strategy
+        verbose: Whether to show AI reasoning
+    """
+    lines = [f"[blue]{label} Download[/blue]"]
+    if len(urls) == 1:
+        lines.append(f"URL: {urls[0]}")
+    else:
+        lines.append(f"URLs ({len(urls)}):")
+        lines.extend(f"  - {url}" for url in urls)
+    lines.append(f"Output Directory: {download_dir}")
+    lines.append(f"Mode: {'Async' if async_mode else 'Sync'}")
+    lines.extend(f"{name}: {value}" for name, value in (extra or {}).items())
 
     # Show AI enhancement status if used
     if ai_metadata and ai_metadata.get("ai_enhanced"):
         confidence = ai_metadata.get("confidence", 0)
-        console.print(f"🤖 AI selected strategy (confidence: {confidence:.2f})")
+        lines.append(f"🤖 AI selected strategy (confidence: {confidence:.2f})")
         if verbose and ai_metadata.get("reasoning"):
-            console.print(f"   AI reasoning: {ai_metadata['reasoning']}")
+            lines.append(f"   AI reasoning: {ai_metadata['reasoning']}")
 
     # Show strategy status
-    if get_feature_flags().is_api_enabled_for_platform("twitter"):
-        console.print("🚀 Using experimental API-direct approach")
-    else:
-        console.print("🖥️ Using CLI-based approach")
-    console.print()
+    lines.append(_API_BANNERS[_api_enabled(platform)])
+    lines.append("")
+    console.print("\n".join(lines))
+
+
+def _render_metadata(metadata: MediaMetadata, platform: str, verbose: bool) -> None:
+    """Print extracted metadata using the platform's field map.
+
+    Args:
+        metadata: Extracted metadata
+        platform: Platform key in ``_METADATA_FIELDS``
+        verbose: Whether to also print the raw metadata
+    """
+    console.print("[green]✓ Metadata extracted successfully[/green]")
+    console.print("\n[bold]Metadata:[/bold]")
+
+    table = Table(show_header=False, box=None, padding=(0, 1, 0, 0))
+    for name, getter in _METADATA_FIELDS[platform]:
+        value = getter(metadata)
+        if value:
+            table.add_row(f"{name}:", str(value))
+    if metadata.download_method:
+        method_emoji = "🚀" if metadata.download_method == "api" else "🖥️"
+        table.add_row(f"{method_emoji} Method:", metadata.download_method.upper())
+    console.print(table)
+
+    if verbose and metadata.raw_metadata:
+        console.print("\n[bold]Raw Metadata:[/bold]")
+        _print_raw_json(metadata.raw_metadata)
+
+
+def _maybe_progress():
+    """Get a spinner for interactive terminals, or a no-op stand-in when output is piped.
+
+    Skipping Rich's Progress when stdout is not a terminal avoids its refresh thread
+    and keeps spinner escape codes out of CI logs and redirected output. On a terminal
+    the spinners are transient, so per-URL tasks are cleared once the batch finishes.
+
+    Returns:
+        Context manager yielding an object with ``add_task`` and ``update`` methods
+    """
+    if not console.is_terminal:
+        return contextlib.nullcontext(SimpleNamespace(add_task=lambda *a, **k: None, update=lambda *a, **k: None))
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console, transient=True
+    )
+
+
+def _report_download(metadata: MediaMetadata, streamed: bool, verbose: bool) -> bool:
+    """Print the outcome of a single download.
+
+    Args:
+        metadata: Metadata returned by the download
+        streamed: Whether file paths were already printed while downloading
+        verbose: Whether to also print the raw metadata
+
+    Returns:
+        True if the download succeeded
+    """
+    if metadata.error:
+        console.print(f"[red]✗ Download failed: {metadata.error}[/red]")
+        return False
+
+    console.print("[green]✓ Download completed successfully[/green]")
+
+    if metadata.files:
+        console.print(f"\n[bold]Downloaded {len(metadata.files)} files:[/bold]")
+        if not streamed:
+            _print_file_list(metadata.files)
+
+    if metadata.download_method:
+        method_emoji = "🚀" if metadata.download_method == "api" else "🖥️"
+        console.print(f"\n{method_emoji} Downloaded using {metadata.download_method.upper()} method")
+
+    if verbose and metadata.raw_metadata:
+        console.print("\n[bold]Metadata:[/bold]")
+        _print_raw_json(metadata.raw_metadata)
+    return True
+
+
+def _platform_download(
+    platform: str,
+    strategy,
+    urls: list[str],
+    download_dir: Path,
+    options: dict,
+    metadata_only: bool,
+    verbose: bool,
+    concurrency: int | None = None,
+    with_metadata: bool = False,
+    rate_limit: float | None = None,
+    retries: int = _DEFAULT_RETRIES,
+) -> None:
+    """Extract metadata or download content for one or more URLs and report the results.
+
+    URLs are processed concurrently; each one gets its own progress task and status block.
+
+    Args:
+        platform: Platform key in ``_METADATA_FIELDS``
+        strategy: Download strategy to use
+        urls: URLs to process
+        download_dir: Directory for downloads, created only when downloading
+        options: Additional strategy options
+        metadata_only: Extract metadata only instead of downloading
+        verbose: Show raw metadata and tracebacks
+        concurrency: Maximum URLs processed at once
+        with_metadata: Fetch metadata concurrently with each download and show it
+        rate_limit: Maximum requests started per second, unlimited if None
+        retries: How many times to retry a URL that failed with a rate-limit error
+
+    Raises:
+        typer.Exit: If metadata extraction or a download fails
+    """
+    # Duplicate URLs in one invocation are processed once
+    urls = list(dict.fromkeys(urls))
+    multiple = len(urls) > 1
+    succeeded = 0
+    limiter = _RateLimiter(rate_limit) if rate_limit else contextlib.nullcontext()
 
     if metadata_only:
         # Extract metadata only
         console.print("[yellow]Extracting metadata...[/yellow]")
+        results = _run(
+            _run_batch(
+                strategy,
+                platform,
+                lambda url: _retrying(lambda: strategy.get_metadata(url, **options), retries, limiter),
+                urls,
+                concurrency,
+            )
+        )
 
-        try:
-            metadata = asyncio.run(strategy.get_metadata(url))
-
-            console.print("[green]✓ Metadata extracted successfully[/green]")
-            console.print("\n[bold]Metadata:[/bold]")
-
-            if metadata.title:
-                console.print(f"Title: {metadata.title}")
-            if metadata.uploader:
-                console.print(f"Author: {metadata.uploader}")
-            if metadata.upload_date:
-                console.print(f"Date: {metadata.upload_date}")
-            if metadata.like_count:
-                console.print(f"Likes: {metadata.like_count}")
-            if metadata.view_count:
-                console.print(f"Retweets: {metadata.view_count}")
-            if metadata.download_method:
-                method_emoji = "🚀" if metadata.download_method == "api" else "🖥️"
-                console.print(f"{method_emoji} Method: {metadata.download_method.upper()}")
-
-            if verbose and metadata.raw_metadata:
-                console.print("\n[bold]Raw Metadata:[/bold]")
-                import json
-
-                console.print(json.dumps(metadata.raw_metadata, indent=2))
-
-        except Exception as e:
-            console.print(f"[red]✗ Failed to extract metadata: {e}[/red]")
-            raise typer.Exit(1)
-
+        for url, result in zip(urls, results, strict=True):
+            if multiple:
+                console.print(f"\n[bold]{url}[/bold]")
+            if isinstance(result, Exception):
+                console.print(f"[red]✗ Failed to extract metadata: {result}[/red]")
+                continue
+            _render_metadata(result, platform, verbose)
+            succeeded += 1
     else:
         # Download content
-        with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-        ) as progress:
-            task = progress.add_task("Downloading content...", total=None)
+        _ensure_dir(download_dir)
+
+        with _maybe_progress() as progress:
+            tasks = {
+                url: progress.add_task(f"Downloading {url}..." if multiple else "Downloading content...", total=None)
+                for url in urls
+            }
+
+            async def download_one(url: str) -> tuple[MediaMetadata, bool, MediaMetadata | Exception | None]:
+                try:
+                    download = _retrying(lambda: _download_content(strategy, url, options), retries, limiter)
+                    if not with_metadata:
+                        return (*await download, None)
+                    # Overlap the metadata round-trip with the (longer) download. Both calls pass the
+                    # same options, so gallery-dl-backed strategies run them on one shared config
+                    lookup = _retrying(lambda: strategy.get_metadata(url, **options), retries, limiter)
+                    info, result = await asyncio.gather(lookup, download, return_exceptions=True)
+                    if isinstance(result, BaseException):
+                        raise result
+                    return (*result, info)
+                finally:
+                    progress.update(tasks[url], completed=True)
+
+            results = _run(_run_batch(strategy, platform, download_one, urls, concurrency))
+
+        for url, result in zip(urls, results, strict=True):
+            if multiple:
+                console.print(f"\n[bold]{url}[/bold]")
+            if isinstance(result, Exception):
+                console.print(f"[red]✗ Download failed: {result}[/red]")
+                if verbose:
+                    from rich.traceback import Traceback
+
+                    console.print("\n[bold]Traceback:[/bold]")
+                    console.print(
+                        Traceback.from_exception(
+                            type(result), result, result.__traceback__, max_frames=20, suppress=[asyncio]
+                        )
+                    )
+                continue
+            metadata, streamed, info = result
+            if isinstance(info, Exception):
+                console.print(f"[yellow]⚠️ Failed to extract metadata: {info}[/yellow]")
+            elif info is not None:
+                _render_metadata(info, platform, verbose)
+            succeeded += _report_download(metadata, streamed, verbose)
+
+    if multiple:
+        console.print(f"\n[bold]{succeeded}/{len(urls)} URLs completed successfully[/bold]")
+    if succeeded < len(urls):
+        raise typer.Exit(1)
 
-            try:
-                metadata = asyncio.run(strategy.download(url))
-                progress.update(task, completed=True)
 
-                if metadata.error:
-                    console.print(f"[red]✗ Download failed: {metadata.error}[/red]")
-                    raise typer.Exit(1)
-                else:
-                    console.print("[green]✓ Download completed successfully[/green]")
+# Options shared by every platform command
+_OutputDirOption = Annotated[Path | None, typer.Option("--output-dir", "-o", help="Directory to save downloads")]
+_AsyncOption = Annotated[bool, typer.Option("--async", help="Use async download mode")]
+_MetadataOnlyOption = Annotated[
+    bool, typer.Option("--metadata-only", "-m", help="Extract metadata only, don't download files")
+]
+_VerboseOption = Annotated[bool, typer.Option("--verbose", "-v", help="Show verbose output")]
+_ConcurrencyOption = Annotated[
+    int | None,
+    typer.Option("--concurrency", "-j", min=1, help="Maximum URLs processed at once (default: min(8, URL count))"),
+]
+_WithMetadataOption = Annotated[bool, typer.Option("--with-metadata", help="Fetch and show metadata while downloading")]
+_RateLimitOption = Annotated[
+    float | None, typer.Option("--rate-limit", min=0.01, help="Maximum requests started per second (default: no limit)")
+]
+_RetriesOption = Annotated[int, typer.Option("--retries", min=0, help="Retries for rate-limited URLs, with backoff")]
+
+
+@dataclass(frozen=True)
+class _PlatformSpec:
+    """Static settings for one platform download command."""
+
+    name: str
+    label: str
+    validator: Callable[[str], str]
+    ai_strategy: bool = False
+
+
+_PLATFORM_SPECS: dict[str, _PlatformSpec] = {
+    spec.name: spec
+    for spec in (
+        _PlatformSpec("twitter", "Twitter", validate_twitter_url, ai_strategy=True),
+        _PlatformSpec("reddit", "Reddit", validate_reddit_url),
+        _PlatformSpec("instagram", "Instagram", validate_instagram_url),
+        _PlatformSpec("youtube", "YouTube", validate_youtube_url),
+    )
+}
+
+
+@dataclass
+class _DownloadRun:
+    """Command-line options shared by every platform download command."""
+
+    output_dir: Path | None
+    async_mode: bool
+    metadata_only: bool
+    verbose: bool
+    concurrency: int | None = None
+    with_metadata: bool = False
+    rate_limit: float | None = None
+    retries: int = _DEFAULT_RETRIES
+
+
+def _close_strategy(strategy) -> None:
+    """Close clients a strategy keeps open between calls, such as the YouTube strategy's yt-dlp client.
 
-                    if metadata.files:
-                        console.print(f"\n[bold]Downloaded {len(metadata.files)} files:[/bold]")
-                        for file_path in metadata.files:
-                            console.print(f"  📄 {file_path}")
+    Args:
+        strategy: Download strategy used by the command
+    """
+    from boss_bot.core.downloads.strategies import BaseDownloadStrategy
 
-                    if metadata.download_method:
-                        method_emoji = "🚀" if metadata.download_method == "api" else "🖥️"
-                        console.print(f"\n{method_emoji} Downloaded using {metadata.download_method.upper()} method")
+    if isinstance(strategy, BaseDownloadStrategy):
+        _run(strategy.aclose())
 
-                    if verbose and metadata.raw_metadata:
-                        console.print("\n[bold]Metadata:[/bold]")
-                        import json
 
-                        console.print(json.dumps(metadata.raw_metadata, indent=2))
+def _download_command(
+    platform: str,
+    urls: list[str],
+    run: _DownloadRun,
+    options: dict | None = None,
+    extra: dict[str, Any] | None = None,
+) -> None:
+    """Validate URLs, pick a strategy, print the banner and run the download for one command.
 
-            except Exception as e:
-                progress.update(task, completed=True)
-                console.print(f"[red]✗ Download failed: {e}[/red]")
-                if verbose:
-                    import traceback
+    Args:
+        platform: Key in ``_PLATFORM_SPECS``
+        urls: URLs passed on the command line
+        run: Shared command-line options
+        options: Platform-specific strategy options
+        extra: Additional ``name: value`` lines for the banner
+
+    Raises:
+        typer.BadParameter: If a URL is not valid for the platform
+        typer.Exit: If no strategy is available or a URL fails
+    """
+    spec = _PLATFORM_SPECS[platform]
+    urls = [spec.validator(url) for url in urls]
+
+    # Created only when files are actually downloaded
+    download_dir = run.output_dir or Path.cwd() / ".downloads"
+
+    if spec.ai_strategy:
+        strategy, ai_metadata = _run(get_ai_enhanced_strategy(urls[0], download_dir))
+    else:
+        strategy, ai_metadata = get_strategy_for_platform(platform, download_dir), None
+    if not strategy:
+        console.print(f"[red]✗ Failed to initialize {spec.label} strategy[/red]")
+        raise typer.Exit(1)
 
-                    console.print(f"\n[bold]Traceback:[/bold]\n{traceback.format_exc()}")
-                raise typer.Exit(1)
+    _print_download_header(
+        spec.label, platform, urls, download_dir, run.async_mode, extra, ai_metadata=ai_metadata, verbose=run.verbose
+    )
+    try:
+        _platform_download(
+            platform,
+            strategy,
+            urls,
+            download_dir,
+            options or {},
+            run.metadata_only,
+            run.verbose,
+            concurrency=run.concurrency,
+            with_metadata=run.with_metadata,
+            rate_limit=run.rate_limit,
+            retries=run.retries,
+        )
+    finally:
+        _close_strategy(strategy)
+
+
+@app.command("twitter")
+def download_twitter(
+    urls: Annotated[list[str], typer.Argument(help="Twitter/X URL(s) to download")],
+    output_dir: _OutputDirOption = None,
+    async_mode: _AsyncOption = False,
+    metadata_only: _MetadataOnlyOption = False,
+    with_metadata: _WithMetadataOption = False,
+    verbose: _VerboseOption = False,
+    concurrency: _ConcurrencyOption = None,
+    rate_limit: _RateLimitOption = None,
+    retries: _RetriesOption = _DEFAULT_RETRIES,
+) -> None:
+    """Download Twitter/X content using strategy pattern.
+
+    Uses the experimental strategy pattern with feature flag support for API-direct or CLI modes.
+
+    Examples:
+        bossctl download twitter https://twitter.com/username/status/123456789
+        bossctl download twitter https://x.com/username/status/123456789 --output-dir ./downloads
+        bossctl download twitter https://twitter.com/username --metadata-only
+        bossctl download twitter https://x.com/a/status/1 https://x.com/b/status/2
+        bossctl download twitter https://x.com/username/status/123456789 --with-metadata
+    """
+    run = _DownloadRun(
+        output_dir=output_dir,
+        async_mode=async_mode,
+        metadata_only=metadata_only,
+        verbose=verbose,
+        concurrency=concurrency,
+        with_metadata=with_metadata,
+        rate_limit=rate_limit,
+        retries=retries,
+    )
+    _download_command("twitter", urls, run)
 
 
 @app.command("reddit")
 def download_reddit(
-    url: Annotated[str, typer.Argument(help="Reddit URL to download")],
-    output_dir: Annotated[Path | None, typer.Option("--output-dir", "-o", help="Directory to save downloads")] = None,
-    async_mode: Annotated[bool, typer.Option("--async", help="Use async download mode")] = False,
-    metadata_only: Annotated[
-        bool, typer.Option("--metadata-only", "-m", help="Extract metadata only, don't download files")
-    ] = False,
-    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Show verbose output")] = False,
+    urls: Annotated[list[str], typer.Argument(help="Reddit URL(s) to download")],
+    output_dir: _OutputDirOption = None,
+    async_mode: _AsyncOption = False,
+    metadata_only: _MetadataOnlyOption = False,
+    with_metadata: _WithMetadataOption = False,
+    verbose: _VerboseOption = False,
+    concurrency: _ConcurrencyOption = None,
+    rate_limit: _RateLimitOption = None,
+    retries: _RetriesOption = _DEFAULT_RETRIES,
     config_file: Annotated[Path | None, typer.Option("--config", help="Custom gallery-dl config file")] = None,
     cookies_file: Annotated[Path | None, typer.Option("--cookies", help="Browser cookies file")] = None,
 ) -> None:
@@ -429,129 +1152,38 @@ def download_reddit(
         bossctl download reddit <url> --output-dir ./downloads --cookies cookies.txt
         bossctl download reddit <url> --metadata-only --config reddit-config.json
     """
-    # Validate URL
-    url = validate_reddit_url(url)
-
-    # Setup download directory
-    download_dir = output_dir or Path.cwd() / ".downloads"
-    download_dir.mkdir(exist_ok=True, parents=True)
-
-    # Initialize strategy
-    strategy = get_strategy_for_platform("reddit", download_dir)
-    if not strategy:
-        console.print("[red]✗ Failed to initialize Reddit strategy[/red]")
-        raise typer.Exit(1)
-
-    console.print("[blue]Reddit Download[/blue]")
-    console.print(f"URL: {url}")
-    console.print(f"Output Directory: {download_dir}")
-    console.print(f"Mode: {'Async' if async_mode else 'Sync'}")
-    if config_file:
-        console.print(f"Config File: {config_file}")
-    if cookies_file:
-        console.print(f"Cookies File: {cookies_file}")
-
-    # Show strategy status
-    if get_feature_flags().is_api_enabled_for_platform("reddit"):
-        console.print("🚀 Using experimental API-direct approach")
-    else:
-        console.print("🖥️ Using CLI-based approach")
-    console.print()
-
-    # Prepare options
+    extra = {}
     options = {}
     if config_file:
+        extra["Config File"] = config_file
         options["config_file"] = config_file
     if cookies_file:
+        extra["Cookies File"] = cookies_file
         options["cookies_file"] = cookies_file
 
-    if metadata_only:
-        # Extract metadata only
-        console.print("[yellow]Extracting metadata...[/yellow]")
-
-        try:
-            metadata = asyncio.run(strategy.get_metadata(url, **options))
-
-            console.print("[green]✓ Metadata extracted successfully[/green]")
-            console.print("\n[bold]Metadata:[/bold]")
-
-            if metadata.title:
-                console.print(f"Title: {metadata.title}")
-            if metadata.uploader:
-                console.print(f"Author: {metadata.uploader}")
-            if metadata.raw_metadata and metadata.raw_metadata.get("subreddit"):
-                console.print(f"Subreddit: r/{metadata.raw_metadata['subreddit']}")
-            if metadata.like_count:
-                console.print(f"Score: {metadata.like_count}")
-            if metadata.raw_metadata and metadata.raw_metadata.get("num_comments"):
-                console.print(f"Comments: {metadata.raw_metadata['num_comments']}")
-            if metadata.upload_date:
-                console.print(f"Posted: {metadata.upload_date}")
-            if metadata.download_method:
-                method_emoji = "🚀" if metadata.download_method == "api" else "🖥️"
-                console.print(f"{method_emoji} Method: {metadata.download_method.upper()}")
-
-            if verbose and metadata.raw_metadata:
-                console.print("\n[bold]Raw Metadata:[/bold]")
-                import json
-
-                console.print(json.dumps(metadata.raw_metadata, indent=2))
-
-        except Exception as e:
-            console.print(f"[red]✗ Failed to extract metadata: {e}[/red]")
-            raise typer.Exit(1)
-
-    else:
-        # Download content
-        with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-        ) as progress:
-            task = progress.add_task("Downloading content...", total=None)
-
-            try:
-                metadata = asyncio.run(strategy.download(url, **options))
-                progress.update(task, completed=True)
-
-                if metadata.error:
-                    console.print(f"[red]✗ Download failed: {metadata.error}[/red]")
-                    raise typer.Exit(1)
-                else:
-                    console.print("[green]✓ Download completed successfully[/green]")
-
-                    if metadata.files:
-                        console.print(f"\n[bold]Downloaded {len(metadata.files)} files:[/bold]")
-                        for file_path in metadata.files:
-                            console.print(f"  📄 {file_path}")
-
-                    if metadata.download_method:
-                        method_emoji = "🚀" if metadata.download_method == "api" else "🖥️"
-                        console.print(f"\n{method_emoji} Downloaded using {metadata.download_method.upper()} method")
-
-                    if verbose and metadata.raw_metadata:
-                        console.print("\n[bold]Metadata:[/bold]")
-                        import json
-
-                        console.print(json.dumps(metadata.raw_metadata, indent=2))
-
-            except Exception as e:
-                progress.update(task, completed=True)
-                console.print(f"[red]✗ Download failed: {e}[/red]")
-                if verbose:
-                    import traceback
-
-                    console.print(f"\n[bold]Traceback:[/bold]\n{traceback.format_exc()}")
-                raise typer.Exit(1)
+    run = _DownloadRun(
+        output_dir=output_dir,
+        async_mode=async_mode,
+        metadata_only=metadata_only,
+        verbose=verbose,
+        concurrency=concurrency,
+        with_metadata=with_metadata,
+        rate_limit=rate_limit,
+        retries=retries,
+    )
+    _download_command("reddit", urls, run, options, extra)
 
 
 @app.command("instagram")
 def download_instagram(
-    url: Annotated[str, typer.Argument(help="Instagram URL to download")],
-    output_dir: Annotated[Path | None, typer.Option("--output-dir", "-o", help="Directory to save downloads")] = None,
-    async_mode: Annotated[bool, typer.Option("--async", help="Use async download mode")] = False,
-    metadata_only: Annotated[
-        bool, typer.Option("--metadata-only", "-m", help="Extract metadata only, don't download files")
-    ] = False,
-    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Show verbose output")] = False,
+    urls: Annotated[list[str], typer.Argument(help="Instagram URL(s) to download")],
+    output_dir: _OutputDirOption = None,
+    async_mode: _AsyncOption = False,
+    metadata_only: _MetadataOnlyOption = False,
+    verbose: _VerboseOption = False,
+    concurrency: _ConcurrencyOption = None,
+    rate_limit: _RateLimitOption = None,
+    retries: _RetriesOption = _DEFAULT_RETRIES,
     cookies_browser: Annotated[
         str | None, typer.Option("--cookies-browser", help="Browser to extract cookies from (default: Firefox)")
     ] = "Firefox",
@@ -568,127 +1200,34 @@ def download_instagram(
         bossctl download instagram <url> --metadata-only --cookies-browser Chrome
         bossctl download instagram <url> --user-agent "Custom Agent 1.0"
     """
-    # Validate URL
-    url = validate_instagram_url(url)
-
-    # Setup download directory
-    download_dir = output_dir or Path.cwd() / ".downloads"
-    download_dir.mkdir(exist_ok=True, parents=True)
-
-    # Initialize strategy
-    strategy = get_strategy_for_platform("instagram", download_dir)
-    if not strategy:
-        console.print("[red]✗ Failed to initialize Instagram strategy[/red]")
-        raise typer.Exit(1)
-
-    console.print("[blue]Instagram Download[/blue]")
-    console.print(f"URL: {url}")
-    console.print(f"Output Directory: {download_dir}")
-    console.print(f"Mode: {'Async' if async_mode else 'Sync'}")
-    console.print(f"Cookies Browser: {cookies_browser}")
-    console.print(f"User Agent: {user_agent}")
-
-    # Show strategy status
-    if get_feature_flags().is_api_enabled_for_platform("instagram"):
-        console.print("🚀 Using experimental API-direct approach")
-    else:
-        console.print("🖥️ Using CLI-based approach")
-    console.print()
-
-    # Prepare options
     options = {}
     if cookies_browser and cookies_browser != "Firefox":
         options["cookies_browser"] = cookies_browser
     if user_agent and user_agent != "Wget/1.21.1":
         options["user_agent"] = user_agent
 
-    if metadata_only:
-        # Extract metadata only
-        console.print("[yellow]Extracting metadata...[/yellow]")
-
-        try:
-            metadata = asyncio.run(strategy.get_metadata(url, **options))
-
-            console.print("[green]✓ Metadata extracted successfully[/green]")
-            console.print("\n[bold]Metadata:[/bold]")
-
-            if metadata.title:
-                console.print(f"Title: {metadata.title}")
-            if metadata.uploader:
-                console.print(f"Author: {metadata.uploader}")
-            if metadata.upload_date:
-                console.print(f"Posted: {metadata.upload_date}")
-            if metadata.like_count:
-                console.print(f"Likes: {metadata.like_count}")
-            if metadata.raw_metadata and metadata.raw_metadata.get("comment_count"):
-                console.print(f"Comments: {metadata.raw_metadata['comment_count']}")
-            if metadata.raw_metadata and metadata.raw_metadata.get("description"):
-                console.print(f"Description: {metadata.raw_metadata['description'][:100]}...")
-            if metadata.download_method:
-                method_emoji = "🚀" if metadata.download_method == "api" else "🖥️"
-                console.print(f"{method_emoji} Method: {metadata.download_method.upper()}")
-
-            if verbose and metadata.raw_metadata:
-                console.print("\n[bold]Raw Metadata:[/bold]")
-                import json
-
-                console.print(json.dumps(metadata.raw_metadata, indent=2))
-
-        except Exception as e:
-            console.print(f"[red]✗ Failed to extract metadata: {e}[/red]")
-            raise typer.Exit(1)
-
-    else:
-        # Download content
-        with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-        ) as progress:
-            task = progress.add_task("Downloading content...", total=None)
-
-            try:
-                metadata = asyncio.run(strategy.download(url, **options))
-                progress.update(task, completed=True)
-
-                if metadata.error:
-                    console.print(f"[red]✗ Download failed: {metadata.error}[/red]")
-                    raise typer.Exit(1)
-                else:
-                    console.print("[green]✓ Download completed successfully[/green]")
-
-                    if metadata.files:
-                        console.print(f"\n[bold]Downloaded {len(metadata.files)} files:[/bold]")
-                        for file_path in metadata.files:
-                            console.print(f"  📄 {file_path}")
-
-                    if metadata.download_method:
-                        method_emoji = "🚀" if metadata.download_method == "api" else "🖥️"
-                        console.print(f"\n{method_emoji} Downloaded using {metadata.download_method.upper()} method")
-
-                    if verbose and metadata.raw_metadata:
-                        console.print("\n[bold]Metadata:[/bold]")
-                        import json
-
-                        console.print(json.dumps(metadata.raw_metadata, indent=2))
-
-            except Exception as e:
-                progress.update(task, completed=True)
-                console.print(f"[red]✗ Download failed: {e}[/red]")
-                if verbose:
-                    import traceback
-
-                    console.print(f"\n[bold]Traceback:[/bold]\n{traceback.format_exc()}")
-                raise typer.Exit(1)
+    run = _DownloadRun(
+        output_dir=output_dir,
+        async_mode=async_mode,
+        metadata_only=metadata_only,
+        verbose=verbose,
+        concurrency=concurrency,
+        rate_limit=rate_limit,
+        retries=retries,
+    )
+    _download_command("instagram", urls, run, options, {"Cookies Browser": cookies_browser, "User Agent": user_agent})
 
 
 @app.command("youtube")
 def download_youtube(
-    url: Annotated[str, typer.Argument(help="YouTube URL to download")],
-    output_dir: Annotated[Path | None, typer.Option("--output-dir", "-o", help="Directory to save downloads")] = None,
-    async_mode: Annotated[bool, typer.Option("--async", help="Use async download mode")] = False,
-    metadata_only: Annotated[
-        bool, typer.Option("--metadata-only", "-m", help="Extract metadata only, don't download files")
-    ] = False,
-    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Show verbose output")] = False,
+    urls: Annotated[list[str], typer.Argument(help="YouTube URL(s) to download")],
+    output_dir: _OutputDirOption = None,
+    async_mode: _AsyncOption = False,
+    metadata_only: _MetadataOnlyOption = False,
+    verbose: _VerboseOption = False,
+    concurrency: _ConcurrencyOption = None,
+    rate_limit: _RateLimitOption = None,
+    retries: _RetriesOption = _DEFAULT_RETRIES,
     quality: Annotated[
         str | None, typer.Option("--quality", "-q", help="Video quality (e.g., 720p, 1080p, best)")
     ] = "best",
@@ -705,227 +1244,152 @@ def download_youtube(
         bossctl download youtube <url> --audio-only --output-dir ./downloads
         bossctl download youtube <url> --metadata-only
     """
-    # Validate URL
-    url = validate_youtube_url(url)
-
-    # Setup download directory
-    download_dir = output_dir or Path.cwd() / ".downloads"
-    download_dir.mkdir(exist_ok=True, parents=True)
-
-    # Initialize strategy
-    strategy = get_strategy_for_platform("youtube", download_dir)
-    if not strategy:
-        console.print("[red]✗ Failed to initialize YouTube strategy[/red]")
-        raise typer.Exit(1)
-
-    console.print("[blue]YouTube Download[/blue]")
-    console.print(f"URL: {url}")
-    console.print(f"Output Directory: {download_dir}")
-    console.print(f"Mode: {'Async' if async_mode else 'Sync'}")
-    console.print(f"Quality: {quality}")
-    console.print(f"Audio Only: {audio_only}")
-
-    # Show strategy status
-    if get_feature_flags().is_api_enabled_for_platform("youtube"):
-        console.print("🚀 Using experimental API-direct approach")
-    else:
-        console.print("🖥️ Using CLI-based approach")
-    console.print()
-
-    # Prepare options
     options = {}
     if quality and quality != "best":
         options["quality"] = quality
     if audio_only:
         options["audio_only"] = True
 
-    if metadata_only:
-        # Extract metadata only
-        console.print("[yellow]Extracting metadata...[/yellow]")
-
-        try:
-            metadata = asyncio.run(strategy.get_metadata(url, **options))
-
-            console.print("[green]✓ Metadata extracted successfully[/green]")
-            console.print("\n[bold]Metadata:[/bold]")
-
-            if metadata.title:
-                console.print(f"Title: {metadata.title}")
-            if metadata.uploader:
-                console.print(f"Channel: {metadata.uploader}")
-            if metadata.upload_date:
-                console.print(f"Upload Date: {metadata.upload_date}")
-            if metadata.duration:
-                console.print(f"Duration: {metadata.duration}")
-            if metadata.view_count:
-                console.print(f"Views: {metadata.view_count}")
-            if metadata.like_count:
-                console.print(f"Likes: {metadata.like_count}")
-            if metadata.download_method:
-                method_emoji = "🚀" if metadata.download_method == "api" else "🖥️"
-                console.print(f"{method_emoji} Method: {metadata.download_method.upper()}")
-
-            if verbose and metadata.raw_metadata:
-                console.print("\n[bold]Raw Metadata:[/bold]")
-                import json
-
-                console.print(json.dumps(metadata.raw_metadata, indent=2))
-
-        except Exception as e:
-            console.print(f"[red]✗ Failed to extract metadata: {e}[/red]")
-            raise typer.Exit(1)
-
-    else:
-        # Download content
-        with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-        ) as progress:
-            task = progress.add_task("Downloading content...", total=None)
-
-            try:
-                metadata = asyncio.run(strategy.download(url, **options))
-                progress.update(task, completed=True)
-
-                if metadata.error:
-                    console.print(f"[red]✗ Download failed: {metadata.error}[/red]")
-                    raise typer.Exit(1)
-                else:
-                    console.print("[green]✓ Download completed successfully[/green]")
-
-                    if metadata.files:
-                        console.print(f"\n[bold]Downloaded {len(metadata.files)} files:[/bold]")
-                        for file_path in metadata.files:
-                            console.print(f"  📄 {file_path}")
-
-                    if metadata.download_method:
-                        method_emoji = "🚀" if metadata.download_method == "api" else "🖥️"
-                        console.print(f"\n{method_emoji} Downloaded using {metadata.download_method.upper()} method")
-
-                    if verbose and metadata.raw_metadata:
-                        console.print("\n[bold]Metadata:[/bold]")
-                        import json
+    run = _DownloadRun(
+        output_dir=output_dir,
+        async_mode=async_mode,
+        metadata_only=metadata_only,
+        verbose=verbose,
+        concurrency=concurrency,
+        rate_limit=rate_limit,
+        retries=retries,
+    )
+    _download_command("youtube", urls, run, options, {"Quality": quality, "Audio Only": audio_only})
+
+
+# Static text for download_info, printed in a single write
+_DOWNLOAD_INFO = "\n".join(
+    (
+        "[bold blue]BossBot Download Commands[/bold blue]",
+        "",
+        "[bold]Supported Platforms:[/bold]",
+        "  🐦 Twitter/X (twitter.com, x.com)",
+        "     - Individual tweets",
+        "     - User profiles",
+        "     - Media content (images, videos)",
+        "",
+        "  🤖 Reddit (reddit.com)",
+        "     - Individual posts",
+        "     - Gallery posts",
+        "     - Video posts",
+        "     - Custom config and cookie support",
+        "",
+        "  📷 Instagram (instagram.com) [EXPERIMENTAL]",
+        "     - Individual posts",
+        "     - User profiles",
+        "     - Stories and highlights",
+        "     - Firefox cookies and custom user agent support",
+        "",
+        "  📺 YouTube (youtube.com) [EXPERIMENTAL]",
+        "     - Individual videos",
+        "     - Playlists",
+        "     - Quality selection (360p-4K)",
+        "     - Audio-only downloads",
+        "",
+        "[bold]Available Commands:[/bold]",
+        "  twitter    - Download Twitter/X content using gallery-dl",
+        "  reddit     - Download Reddit content using gallery-dl",
+        "  instagram  - Download Instagram content using gallery-dl [EXPERIMENTAL]",
+        "  youtube    - Download YouTube content using yt-dlp [EXPERIMENTAL]",
+        "",
+        "[bold]Configuration Commands:[/bold]",
+        "  validate-config   - Validate gallery-dl config for platform (instagram)",
+        "  check-config      - Check config with detailed output",
+        "  config-summary    - Show current config values",
+        "  strategies        - Show strategy configuration",
+        "",
+        "[bold]Strategy Features:[/bold]",
+        "  🚀 API-Direct Mode: Experimental direct API integration",
+        "  🖥️ CLI Mode: Stable subprocess-based approach (default)",
+        "  🔄 Auto-Fallback: API failures automatically fallback to CLI",
+        "  ⚙️ Feature Flags: Environment variable control (e.g., TWITTER_USE_API_CLIENT=true)",
+        "",
+        "[bold]Examples:[/bold]",
+        "  bossctl download twitter https://twitter.com/username/status/123",
+        "  bossctl download twitter https://x.com/username --metadata-only",
+        "  bossctl download reddit https://reddit.com/r/pics/comments/abc123/title/",
+        "  bossctl download instagram https://instagram.com/p/ABC123/",
+        "  bossctl download youtube https://youtube.com/watch?v=VIDEO_ID --quality 720p",
+    )
+)
 
-                        console.print(json.dumps(metadata.raw_metadata, indent=2))
 
-            except Exception as e:
-                progress.update(task, completed=True)
-                console.print(f"[red]✗ Download failed: {e}[/red]")
-                if verbose:
-                    import traceback
-
-                    console.print(f"\n[bold]Traceback:[/bold]\n{traceback.format_exc()}")
-                raise typer.Exit(1)
+@functools.cache
+def _download_info_text() -> Text:
+    """Parse the download_info markup once per process instead of on every call."""
+    return Text.from_markup(_DOWNLOAD_INFO)
 
 
 @app.command("info")
 def download_info() -> None:
     """Show information about download capabilities."""
-    console.print("[bold blue]BossBot Download Commands[/bold blue]")
-    console.print()
-
-    console.print("[bold]Supported Platforms:[/bold]")
-    console.print("  🐦 Twitter/X (twitter.com, x.com)")
-    console.print("     - Individual tweets")
-    console.print("     - User profiles")
-    console.print("     - Media content (images, videos)")
-    console.print()
-    console.print("  🤖 Reddit (reddit.com)")
-    console.print("     - Individual posts")
-    console.print("     - Gallery posts")
-    console.print("     - Video posts")
-    console.print("     - Custom config and cookie support")
-    console.print()
-    console.print("  📷 Instagram (instagram.com) [EXPERIMENTAL]")
-    console.print("     - Individual posts")
-    console.print("     - User profiles")
-    console.print("     - Stories and highlights")
-    console.print("     - Firefox cookies and custom user agent support")
-    console.print()
-    console.print("  📺 YouTube (youtube.com) [EXPERIMENTAL]")
-    console.print("     - Individual videos")
-    console.print("     - Playlists")
-    console.print("     - Quality selection (360p-4K)")
-    console.print("     - Audio-only downloads")
-    console.print()
-
-    console.print("[bold]Available Commands:[/bold]")
-    console.print("  twitter    - Download Twitter/X content using gallery-dl")
-    console.print("  reddit     - Download Reddit content using gallery-dl")
-    console.print("  instagram  - Download Instagram content using gallery-dl [EXPERIMENTAL]")
-    console.print("  youtube    - Download YouTube content using yt-dlp [EXPERIMENTAL]")
-    console.print()
-
-    console.print("[bold]Configuration Commands:[/bold]")
-    console.print("  validate-config   - Validate gallery-dl config for platform (instagram)")
-    console.print("  check-config      - Check config with detailed output")
-    console.print("  config-summary    - Show current config values")
-    console.print("  strategies        - Show strategy configuration")
-    console.print()
-
-    console.print("[bold]Strategy Features:[/bold]")
-    console.print("  🚀 API-Direct Mode: Experimental direct API integration")
-    console.print("  🖥️ CLI Mode: Stable subprocess-based approach (default)")
-    console.print("  🔄 Auto-Fallback: API failures automatically fallback to CLI")
-    console.print("  ⚙️ Feature Flags: Environment variable control (e.g., TWITTER_USE_API_CLIENT=true)")
-    console.print()
-
-    console.print("[bold]Examples:[/bold]")
-    console.print("  bossctl download twitter https://twitter.com/username/status/123")
-    console.print("  bossctl download twitter https://x.com/username --metadata-only")
-    console.print("  bossctl download reddit https://reddit.com/r/pics/comments/abc123/title/")
-    console.print("  bossctl download instagram https://instagram.com/p/ABC123/")
-    console.print("  bossctl download youtube https://youtube.com/watch?v=VIDEO_ID --quality 720p")
+    console.print(_download_info_text())
+
+
+# Status labels for show_strategies, keyed by feature flag state
+_STATUS = {True: "🚀 API-Direct", False: "🖥️ CLI Mode"}
+_ENABLED_LABEL = {True: "✅ Enabled", False: "❌ Disabled"}
+
+# (label, strategy info key) rows shown by show_strategies
+_PLATFORMS: tuple[tuple[str, str], ...] = (
+    ("🐦 Twitter/X", "twitter_api"),
+    ("🤖 Reddit", "reddit_api"),
+    ("📺 YouTube", "youtube_api"),
+    ("📷 Instagram", "instagram_api"),
+)
+_AI_FEATURES: tuple[tuple[str, str], ...] = (
+    ("Strategy Selection", "ai_strategy_selection"),
+    ("Content Analysis", "ai_content_analysis"),
+    ("Workflow Orchestration", "ai_workflow_orchestration"),
+)
 
 
 @app.command("strategies")
 def show_strategies() -> None:
     """Show current download strategy configuration."""
-    info = get_feature_flags().get_strategy_info()
-
-    console.print("[bold blue]Download Strategy Configuration[/bold blue]")
-    console.print()
-
-    platforms = [
-        ("🐦 Twitter/X", "twitter_api"),
-        ("🤖 Reddit", "reddit_api"),
-        ("📺 YouTube", "youtube_api"),
-        ("📷 Instagram", "instagram_api"),
+    info = _strategy_info(get_feature_flags())
+
+    strategy_table = Table(show_header=False, box=None)
+    for emoji_name, key in _PLATFORMS:
+        strategy_table.add_row(f"{emoji_name}:", _STATUS[bool(info[key])])
+
+    ai_table = Table(show_header=False, box=None)
+    for feature_name, key in _AI_FEATURES:
+        ai_table.add_row(f"- {feature_name}:", _ENABLED_LABEL[bool(info[key])])
+
+    parts: list[Any] = [
+        "[bold blue]Download Strategy Configuration[/bold blue]",
+        "",
+        strategy_table,
+        "",
+        f"🔄 **API Fallback**: {_ENABLED_LABEL[bool(info['api_fallback'])]}",
+        "",
+        "[bold blue]🤖 AI Enhancement Status[/bold blue]",
+        ai_table,
+        "",
     ]
 
-    for emoji_name, key in platforms:
-        status = "🚀 **API-Direct**" if info[key] else "🖥️ **CLI Mode**"
-        console.print(f"{emoji_name}: {status}")
-
-    console.print()
-    console.print(f"🔄 **API Fallback**: {'✅ Enabled' if info['api_fallback'] else '❌ Disabled'}")
-
-    # Show AI Enhancement Status
-    console.print()
-    console.print("[bold blue]🤖 AI Enhancement Status[/bold blue]")
-    console.print(f"- Strategy Selection: {'✅ Enabled' if info['ai_strategy_selection'] else '❌ Disabled'}")
-    console.print(f"- Content Analysis: {'✅ Enabled' if info['ai_content_analysis'] else '❌ Disabled'}")
-    console.print(f"- Workflow Orchestration: {'✅ Enabled' if info['ai_workflow_orchestration'] else '❌ Disabled'}")
-
     # Show AI agent availability
     if AI_AGENTS_AVAILABLE:
-        console.print()
-        console.print("[bold green]AI Agents Available:[/bold green]")
-        strategy_selector_agent = get_strategy_selector_agent()
-        if strategy_selector_agent:
-            console.print("  ✅ Strategy Selector Agent: Ready")
+        parts.append("[bold green]AI Agents Available:[/bold green]")
+        if get_strategy_selector_agent():
+            parts.append("  ✅ Strategy Selector Agent: Ready")
         else:
-            console.print("  ❌ Strategy Selector Agent: Not initialized")
-        content_analyzer_agent = get_content_analyzer_agent()
-        if content_analyzer_agent:
-            console.print("  ✅ Content Analyzer Agent: Ready")
+            parts.append("  ❌ Strategy Selector Agent: Not initialized")
+        if get_content_analyzer_agent():
+            parts.append("  ✅ Content Analyzer Agent: Ready")
         else:
-            console.print("  ❌ Content Analyzer Agent: Not initialized")
+            parts.append("  ❌ Content Analyzer Agent: Not initialized")
     else:
-        console.print()
-        console.print("[yellow]AI agents not available - modules not installed[/yellow]")
+        parts.append("[yellow]AI agents not available - modules not installed[/yellow]")
 
-    console.print()
-    console.print("💡 *Tip: Enable AI features with `AI_STRATEGY_SELECTION_ENABLED=true`*")
+    parts += ["", "💡 *Tip: Enable AI features with `AI_STRATEGY_SELECTION_ENABLED=true`*"]
+    console.print(Group(*parts))
 
 
 @app.command("validate-config")
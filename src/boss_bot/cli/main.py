@@ -19,45 +19,46 @@ from boss_bot.monitoring.exceptions import init_secure_exceptions
 init_secure_exceptions()
 
 import asyncio
-import inspect
+import contextlib
 import json
-import logging
 import os
+import re
 import signal
-import subprocess
 import sys
-import tempfile
+import threading
 import traceback
-import typing
-from collections.abc import Awaitable, Callable, Iterable, Sequence
-from enum import Enum
-from functools import partial, wraps
-from importlib import import_module, metadata
-from importlib.metadata import version as importlib_metadata_version
+from collections.abc import Callable
+from functools import cache, wraps
+from importlib import import_module
+from importlib.metadata import distributions
+from itertools import islice
 from pathlib import Path
-from re import Pattern
 from types import FrameType
-from typing import TYPE_CHECKING, Annotated, Any, Dict, List, NoReturn, Optional, Set, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, NoReturn
 
-import bpdb
-import pysnooper
-import rich
+import click
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
 
-import boss_bot
 from boss_bot.__version__ import __version__
-from boss_bot.bot.client import BossBot
-from boss_bot.cli.commands import assistants_app, download_app
-from boss_bot.core.env import BossSettings
+from boss_bot.cli.utils.runner import loop_factory
 from boss_bot.utils.asynctyper import AsyncTyper
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 if TYPE_CHECKING:
+    from rich.console import Console
+
     from boss_bot.core.downloads.clients.aio_gallery_dl import AsyncGalleryDL
     from boss_bot.core.downloads.clients.aio_yt_dlp import AsyncYtDlp
+    from boss_bot.core.env import BossSettings
 
 # 🔥 STEP 3: Configure full logging features after imports
-from boss_bot.core.env import BossSettings
 from boss_bot.monitoring.logging import setup_boss_bot_logging
 
 # Initialize boss-bot settings
@@ -70,18 +71,116 @@ LOGGER = setup_boss_bot_logging()
 # Set up logging
 # LOGGER = logging.getLogger(__name__)
 
-APP = AsyncTyper()
-console = Console()
-cprint = console.print
+# Subcommand name -> module path; imported by LazyCommandGroup only when the subcommand runs.
+# load_commands() adds any *_cmd.py modules found in the subcommands directory.
+LAZY_SUBCOMMANDS: dict[str, str] = {
+    "download": "boss_bot.cli.commands.download",
+    "assistants": "boss_bot.cli.commands.assistants",
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """Root command group that imports ``*_cmd.py`` subcommand modules on first use.
+
+    ``load_commands()`` only records module paths; the module (and its dependencies)
+    is imported when the subcommand is looked up, so commands like ``version`` never
+    pay for it.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        commands = super().list_commands(ctx)
+        return commands + [name for name in LAZY_SUBCOMMANDS if name not in commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in LAZY_SUBCOMMANDS:
+            return command
+
+        try:
+            module = import_module(LAZY_SUBCOMMANDS[cmd_name])
+        except Exception as e:
+            LOGGER.error(f"Error loading subcommand {cmd_name}: {e}")
+            return None
+        if not hasattr(module, "app"):
+            return None
+
+        command = typer.main.get_command(module.app)
+        command.name = cmd_name
+        self.add_command(command, cmd_name)
+        return command
+
+
+APP = AsyncTyper(cls=LazyCommandGroup)
+
+
+@cache
+def get_settings() -> BossSettings:
+    """Get or create the settings instance shared by the CLI commands."""
+    from boss_bot.core.env import BossSettings
+
+    return BossSettings()
+
+
+def _json_dumps(data: Any) -> str:
+    """Format data as 2-space indented JSON for display, using orjson when installed.
+
+    Args:
+        data: JSON-serializable data; unknown types are converted with ``str``
+
+    Returns:
+        The indented JSON text
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+    return json.dumps(data, indent=2, default=str)
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes, using orjson when installed.
+
+    Args:
+        data: The JSON document
+
+    Returns:
+        The parsed data
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson's error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@cache
+def get_console() -> Console:
+    """Get or create the rich console shared by the CLI commands."""
+    from rich.console import Console
+
+    return Console()
+
+
+def cprint(*objects: Any, **kwargs: Any) -> None:
+    """Print to the shared rich console, creating it on first use."""
+    get_console().print(*objects, **kwargs)
+
+
+def buffered_output(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Collect a command's console output and write it once when the command returns.
+
+    Rich flushes to the terminal after every ``print``; inside ``with console:`` the
+    rendered output is buffered and written in a single call on exit.
+    """
 
-# Add download commands
-APP.add_typer(download_app, name="download")
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with get_console():
+            return func(*args, **kwargs)
 
-# Add assistant commands
-APP.add_typer(assistants_app, name="assistants")
+    return wrapper
 
 
-# Load existing subcommands
+# Register existing subcommands (imported lazily by LazyCommandGroup)
 def load_commands(directory: str = "subcommands"):
     script_dir = Path(__file__).parent
     subcommands_dir = script_dir / directory
@@ -94,43 +193,66 @@ def load_commands(directory: str = "subcommands"):
     LOGGER.info(f"Loading subcommands from {subcommands_dir}")
 
     try:
-        for filename in os.listdir(subcommands_dir):
-            if filename.endswith("_cmd.py"):
-                module_name = f"{__name__.split('.')[0]}.{directory}.{filename[:-3]}"
-                module = import_module(module_name)
-                if hasattr(module, "app"):
-                    APP.add_typer(module.app, name=filename[:-7])
+        prefix = f"{__package__}.{directory}."
+        with os.scandir(subcommands_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith("_cmd.py") and entry.is_file():
+                    LAZY_SUBCOMMANDS[name[:-7]] = prefix + name[:-3]
     except Exception as e:
         LOGGER.error(f"Error loading subcommands: {e}")
 
 
+@cache
+def _ensure_commands_loaded() -> None:
+    """Discover subcommand modules once per process, before the CLI parses argv."""
+    load_commands()
+
+
 def version_callback(version: bool) -> None:
     """Print the version of boss_bot."""
     if version:
-        rich.print(f"boss_bot version: {__version__}")
+        print(f"boss_bot version: {__version__}")
         raise typer.Exit()
 
 
 @APP.command()
 def version() -> None:
     """Version command"""
-    rich.print(f"boss_bot version: {__version__}")
+    print(f"boss_bot version: {__version__}")
+
+
+# Packages reported by the deps command
+DEPS_PACKAGES: tuple[str, ...] = (
+    "langchain",
+    "langchain_community",
+    "langchain_core",
+    "langchain_openai",
+    "langchain_text_splitters",
+    "chromadb",
+    "langsmith",
+    "pydantic",
+    "pydantic_settings",
+    "ruff",
+)
+
+
+def _normalize_dist_name(name: str) -> str:
+    """Normalize a distribution name so ``langchain_core`` and ``langchain-core`` compare equal."""
+    return re.sub(r"[-_.]+", "-", name).lower()
 
 
 @APP.command()
 def deps() -> None:
     """Deps command"""
-    rich.print(f"boss_bot version: {__version__}")
-    rich.print(f"langchain_version: {importlib_metadata_version('langchain')}")
-    rich.print(f"langchain_community_version: {importlib_metadata_version('langchain_community')}")
-    rich.print(f"langchain_core_version: {importlib_metadata_version('langchain_core')}")
-    rich.print(f"langchain_openai_version: {importlib_metadata_version('langchain_openai')}")
-    rich.print(f"langchain_text_splitters_version: {importlib_metadata_version('langchain_text_splitters')}")
-    rich.print(f"chromadb_version: {importlib_metadata_version('chromadb')}")
-    rich.print(f"langsmith_version: {importlib_metadata_version('langsmith')}")
-    rich.print(f"pydantic_version: {importlib_metadata_version('pydantic')}")
-    rich.print(f"pydantic_settings_version: {importlib_metadata_version('pydantic_settings')}")
-    rich.print(f"ruff_version: {importlib_metadata_version('ruff')}")
+    # One pass over the installed distributions instead of a metadata lookup per package.
+    # The first match on sys.path wins, as with importlib.metadata.version().
+    installed: dict[str, str] = {}
+    for dist in distributions():
+        installed.setdefault(_normalize_dist_name(dist.metadata["Name"] or ""), dist.version)
+    print(f"boss_bot version: {__version__}")
+    for package in DEPS_PACKAGES:
+        print(f"{package}_version: {installed.get(_normalize_dist_name(package), 'not installed')}")
 
 
 @APP.command()
@@ -145,95 +267,128 @@ def show() -> None:
     cprint("\nShow boss_bot", style="yellow")
 
 
+# Environment variables reported by the config command
+CONFIG_ENV_VARS: tuple[str, ...] = (
+    # Core settings
+    "DISCORD_TOKEN",
+    "OPENAI_API_KEY",
+    "LANGCHAIN_API_KEY",
+    "PREFIX",
+    "DEBUG",
+    "LOG_LEVEL",
+    "ENVIRONMENT",
+    # Feature flags
+    "ENABLE_AI",
+    "ENABLE_REDIS",
+    "ENABLE_SENTRY",
+    # Download settings
+    "MAX_QUEUE_SIZE",
+    "MAX_CONCURRENT_DOWNLOADS",
+    "STORAGE_ROOT",
+    "MAX_FILE_SIZE_MB",
+    # Strategy feature flags
+    "TWITTER_USE_API_CLIENT",
+    "REDDIT_USE_API_CLIENT",
+    "INSTAGRAM_USE_API_CLIENT",
+    "YOUTUBE_USE_API_CLIENT",
+    "DOWNLOAD_API_FALLBACK_TO_CLI",
+    # Monitoring
+    "ENABLE_METRICS",
+    "METRICS_PORT",
+    "ENABLE_HEALTH_CHECK",
+    "HEALTH_CHECK_PORT",
+)
+
+# Environment variable name fragments whose values are never echoed
+SENSITIVE_ENV_RE = re.compile(r"TOKEN|SECRET|PASSWORD|API_KEY")
+
+
 @APP.command()
+@buffered_output
 def config() -> None:
     """Show BossSettings configuration and environment variables"""
-    import json
-
     from pydantic import SecretStr
 
-    settings = BossSettings()
+    settings = get_settings()
 
     cprint("\n[bold blue]BossBot Configuration[/bold blue]", style="bold blue")
     cprint("=" * 50, style="blue")
 
-    # Get all fields from the settings
+    from rich.console import Group
+    from rich.text import Text
+
+    # Build styled Text directly so values are never parsed as markup, then render all fields at once
+    fields: list[Text] = []
     for field_name, field_info in settings.model_fields.items():
         value = getattr(settings, field_name)
 
         # Handle SecretStr fields - don't unmask them
         if isinstance(value, SecretStr):
-            display_value = "[yellow]<SECRET>[/yellow]"
+            display_value: str | tuple[str, str] = ("<SECRET>", "yellow")
         elif isinstance(value, (dict, list)):
             # Pretty print complex types
-            display_value = json.dumps(value, indent=2, default=str)
+            display_value = _json_dumps(value)
         else:
             display_value = str(value)
 
+        fields.append(Text.assemble("\n", (field_name, "bold green"), ": ", display_value))
+
         # Get field description from docstring if available
-        description = field_info.description or ""
+        if field_info.description:
+            fields.append(Text.assemble("  ", (field_info.description, "dim")))
 
-        cprint(f"\n[bold green]{field_name}[/bold green]: {display_value}")
-        if description:
-            cprint(f"  [dim]{description}[/dim]")
+    cprint(Group(*fields))
 
     cprint("\n" + "=" * 50, style="blue")
     cprint("[bold blue]Environment Variables Status[/bold blue]", style="bold blue")
 
     # Check key environment variables
-    import os
-
-    env_vars_to_check = [
-        # Core settings
-        "DISCORD_TOKEN",
-        "OPENAI_API_KEY",
-        "LANGCHAIN_API_KEY",
-        "PREFIX",
-        "DEBUG",
-        "LOG_LEVEL",
-        "ENVIRONMENT",
-        # Feature flags
-        "ENABLE_AI",
-        "ENABLE_REDIS",
-        "ENABLE_SENTRY",
-        # Download settings
-        "MAX_QUEUE_SIZE",
-        "MAX_CONCURRENT_DOWNLOADS",
-        "STORAGE_ROOT",
-        "MAX_FILE_SIZE_MB",
-        # Strategy feature flags
-        "TWITTER_USE_API_CLIENT",
-        "REDDIT_USE_API_CLIENT",
-        "INSTAGRAM_USE_API_CLIENT",
-        "YOUTUBE_USE_API_CLIENT",
-        "DOWNLOAD_API_FALLBACK_TO_CLI",
-        # Monitoring
-        "ENABLE_METRICS",
-        "METRICS_PORT",
-        "ENABLE_HEALTH_CHECK",
-        "HEALTH_CHECK_PORT",
-    ]
-
-    for var in env_vars_to_check:
-        value = os.getenv(var)
+    env = os.environ
+    statuses: list[Text] = []
+    for var in CONFIG_ENV_VARS:
+        value = env.get(var)
         if value is not None:
             # Mask sensitive values
-            if any(keyword in var for keyword in ["TOKEN", "SECRET", "PASSWORD", "API_KEY"]):
-                display_value = "[yellow]<SET>[/yellow]"
-            else:
-                display_value = value
-            cprint(f"[green]✓[/green] {var}: {display_value}")
+            display_value = ("<SET>", "yellow") if SENSITIVE_ENV_RE.search(var) else value
+            statuses.append(Text.assemble(("✓", "green"), f" {var}: ", display_value))
         else:
-            cprint(f"[red]✗[/red] {var}: [dim]not set[/dim]")
+            statuses.append(Text.assemble(("✗", "red"), f" {var}: ", ("not set", "dim")))
+
+    cprint(Group(*statuses))
+
+
+# Case-insensitive patterns for config content that must be masked before display
+_SENSITIVE_GALLERY_DL_LINE_RE = re.compile(r"password|token|key|secret", re.IGNORECASE)
+_SENSITIVE_YT_DLP_LINE_RE = re.compile(r"password|token|username|key|secret|cookie", re.IGNORECASE)
+_SENSITIVE_CONFIG_KEY_RE = re.compile(r"password|token|key|secret|user|auth|cookie|session", re.IGNORECASE)
+
+
+def _read_config_head(config_path: Path, max_lines: int) -> tuple[list[str], int]:
+    """Read the first lines of a config file and count the rest.
+
+    Lines past ``max_lines`` are counted while streaming rather than held in memory.
+
+    Args:
+        config_path: Path to the config file
+        max_lines: Maximum number of lines to return
+
+    Returns:
+        The first ``max_lines`` lines and the number of lines that follow them
+    """
+    with open(config_path, "rb") as f:
+        head = [line.decode() for line in islice(f, max_lines)]
+        remaining = sum(1 for _ in f)
+    return head, remaining
 
 
 @APP.command()
+@buffered_output
 def show_configs(
     dump: bool = typer.Option(False, "--dump", help="Dump GalleryDLConfig as pretty-printed dictionary"),
 ) -> None:
     """Show gallery-dl and yt-dlp configuration files"""
-    import json
-    from pathlib import Path
+    from rich.console import Group
+    from rich.text import Text
 
     cprint("\n[bold blue]Download Tool Configurations[/bold blue]", style="bold blue")
     cprint("=" * 60, style="blue")
@@ -247,40 +402,43 @@ def show_configs(
 
     gallery_config_found = False
     for config_path in gallery_dl_configs:
-        if config_path.exists():
-            gallery_config_found = True
-            cprint(f"[green]✓[/green] Found config: {config_path}")
-            try:
-                with open(config_path) as f:
-                    config_content = f.read()
-
-                # Try to parse as JSON first
-                try:
-                    config_data = json.loads(config_content)
-                    # Mask sensitive data
-                    masked_config = _mask_sensitive_config(config_data)
-                    formatted_config = json.dumps(masked_config, indent=2)
-                    cprint(f"\n[dim]{formatted_config}[/dim]")
-                except json.JSONDecodeError:
-                    # If not JSON, show as plain text (but mask sensitive lines)
-                    lines = config_content.split("\n")
-                    for line in lines[:20]:  # Show first 20 lines
-                        if any(keyword in line.lower() for keyword in ["password", "token", "key", "secret"]):
-                            # Mask the value part
-                            if "=" in line or ":" in line:
-                                separator = "=" if "=" in line else ":"
-                                key_part = line.split(separator)[0]
-                                cprint(f"[dim]{key_part}{separator} <MASKED>[/dim]")
-                            else:
-                                cprint(f"[dim]{line}[/dim]")
-                        else:
-                            cprint(f"[dim]{line}[/dim]")
-                    if len(lines) > 20:
-                        cprint(f"[dim]... ({len(lines) - 20} more lines)[/dim]")
-            except Exception as e:
-                cprint(f"[red]Error reading config: {e}[/red]")
-        else:
+        try:
+            config_content = config_path.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
             cprint(f"[red]✗[/red] Not found: {config_path}")
+            continue
+        except OSError as e:
+            cprint(f"[red]Error reading config {config_path}: {e}[/red]")
+            continue
+
+        gallery_config_found = True
+        cprint(f"[green]✓[/green] Found config: {config_path}")
+        try:
+            # Try to parse as JSON first
+            try:
+                config_data = _json_loads(config_content)
+                # Mask sensitive data
+                masked_config = _mask_sensitive_config(config_data)
+                formatted_config = _json_dumps(masked_config)
+                cprint(Text(f"\n{formatted_config}", style="dim"))
+            except json.JSONDecodeError:
+                # If not JSON, show as plain text (but mask sensitive lines)
+                lines = config_content.decode().split("\n")
+                preview = []
+                for line in lines[:20]:  # Show first 20 lines
+                    if _SENSITIVE_GALLERY_DL_LINE_RE.search(line) and ("=" in line or ":" in line):
+                        # Mask the value part
+                        separator = "=" if "=" in line else ":"
+                        key_part = line.split(separator)[0]
+                        preview.append(Text(f"{key_part}{separator} <MASKED>", style="dim"))
+                    else:
+                        preview.append(Text(line, style="dim"))
+                if preview:
+                    cprint(Group(*preview))
+                if len(lines) > 20:
+                    cprint(f"[dim]... ({len(lines) - 20} more lines)[/dim]")
+        except Exception as e:
+            cprint(f"[red]Error reading config: {e}[/red]")
 
     if not gallery_config_found:
         cprint("[yellow]ℹ️  No gallery-dl config found. Using default settings.[/yellow]")
@@ -289,44 +447,46 @@ def show_configs(
     cprint("\n[bold green]yt-dlp Configuration[/bold green]")
     cprint("-" * 25, style="green")
 
+    home = Path.home()
     yt_dlp_configs = [
-        Path.home() / ".config" / "yt-dlp" / "config",
-        Path.home() / ".config" / "yt-dlp" / "config.txt",
-        Path.home() / "yt-dlp.conf",
+        home / ".config" / "yt-dlp" / "config",
+        home / ".config" / "yt-dlp" / "config.txt",
+        home / "yt-dlp.conf",
         Path.cwd() / "yt-dlp.conf",
     ]
 
     yt_dlp_config_found = False
     for config_path in yt_dlp_configs:
-        if config_path.exists():
-            yt_dlp_config_found = True
-            cprint(f"[green]✓[/green] Found config: {config_path}")
-            try:
-                with open(config_path) as f:
-                    lines = f.readlines()
-                    for line in lines[:30]:  # Show first 30 lines
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            # Mask sensitive options
-                            if any(
-                                keyword in line.lower()
-                                for keyword in ["password", "token", "username", "key", "secret", "cookie"]
-                            ):
-                                if line.startswith("--"):
-                                    option = line.split()[0] if " " in line else line
-                                    cprint(f"[dim]{option} <MASKED>[/dim]")
-                                else:
-                                    cprint("[dim]<MASKED LINE>[/dim]")
-                            else:
-                                cprint(f"[dim]{line}[/dim]")
-                        elif line.startswith("#"):
-                            cprint(f"[dim green]{line}[/dim green]")
-                    if len(lines) > 30:
-                        cprint(f"[dim]... ({len(lines) - 30} more lines)[/dim]")
-            except Exception as e:
-                cprint(f"[red]Error reading config: {e}[/red]")
-        else:
+        try:
+            lines, remaining = _read_config_head(config_path, 30)  # Show first 30 lines
+        except (FileNotFoundError, NotADirectoryError):
             cprint(f"[red]✗[/red] Not found: {config_path}")
+            continue
+        except Exception as e:
+            cprint(f"[red]Error reading config {config_path}: {e}[/red]")
+            continue
+
+        yt_dlp_config_found = True
+        cprint(f"[green]✓[/green] Found config: {config_path}")
+        preview = []
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                # Mask sensitive options
+                if _SENSITIVE_YT_DLP_LINE_RE.search(line):
+                    if line.startswith("--"):
+                        option = line.split()[0] if " " in line else line
+                        preview.append(Text(f"{option} <MASKED>", style="dim"))
+                    else:
+                        preview.append(Text("<MASKED LINE>", style="dim"))
+                else:
+                    preview.append(Text(line, style="dim"))
+            elif line.startswith("#"):
+                preview.append(Text(line, style="dim green"))
+        if preview:
+            cprint(Group(*preview))
+        if remaining:
+            cprint(f"[dim]... ({remaining} more lines)[/dim]")
 
     if not yt_dlp_config_found:
         cprint("[yellow]ℹ️  No yt-dlp config found. Using default settings.[/yellow]")
@@ -352,7 +512,7 @@ def show_configs(
             config_dict = config.to_dict()
 
             # Pretty print the configuration dictionary
-            formatted_config = json.dumps(config_dict, indent=2, default=str)
+            formatted_config = _json_dumps(config_dict)
             cprint(formatted_config)
 
         except Exception as e:
@@ -360,24 +520,36 @@ def show_configs(
 
 
 def _mask_sensitive_config(config_data: dict) -> dict:
-    """Recursively mask sensitive configuration values."""
+    """Mask sensitive configuration values at any depth.
+
+    Nested dicts, including dicts directly inside lists, are walked with an explicit
+    work list so deep configs do not recurse. The input is left untouched.
+    """
     if not isinstance(config_data, dict):
         return config_data
 
-    masked_config = {}
-    sensitive_keys = ["password", "token", "key", "secret", "username", "user", "auth", "cookie", "session"]
-
-    for key, value in config_data.items():
-        key_lower = key.lower()
-
-        if any(sensitive in key_lower for sensitive in sensitive_keys):
-            masked_config[key] = "<MASKED>"
-        elif isinstance(value, dict):
-            masked_config[key] = _mask_sensitive_config(value)
-        elif isinstance(value, list):
-            masked_config[key] = [_mask_sensitive_config(item) if isinstance(item, dict) else item for item in value]
-        else:
-            masked_config[key] = value
+    masked_config: dict = {}
+    pending = [(config_data, masked_config)]
+
+    while pending:
+        source, target = pending.pop()
+        for key, value in source.items():
+            if _SENSITIVE_CONFIG_KEY_RE.search(key):
+                target[key] = "<MASKED>"
+            elif isinstance(value, dict):
+                target[key] = nested = {}
+                pending.append((value, nested))
+            elif isinstance(value, list):
+                items = target[key] = []
+                for item in value:
+                    if isinstance(item, dict):
+                        nested = {}
+                        pending.append((item, nested))
+                        items.append(nested)
+                    else:
+                        items.append(item)
+            else:
+                target[key] = value
 
     return masked_config
 
@@ -390,10 +562,7 @@ def fetch(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be downloaded without actually downloading"),
 ) -> None:
     """Download media from URLs using appropriate API client (gallery-dl or yt-dlp)"""
-    import asyncio
-    from pathlib import Path
-
-    settings = BossSettings()
+    settings = get_settings()
 
     # Ensure output directory exists
     output_path = Path(output_dir)
@@ -411,7 +580,7 @@ def fetch(
 
     try:
         # Run the async download process
-        asyncio.run(_download_urls_async(urls, output_path, verbose, dry_run))
+        asyncio.run(_download_urls_async(urls, output_path, verbose, dry_run), loop_factory=loop_factory())
     except Exception as e:
         print(f"{e}")
         exc_type, exc_value, exc_traceback = sys.exc_info()
@@ -424,6 +593,8 @@ def fetch(
 
         # Only launch debugger if in dev mode and not in test mode
         if settings.debug:
+            import bpdb
+
             bpdb.pm()
 
         LOGGER.error("Error in gallery-dl download")
@@ -436,47 +607,57 @@ async def _download_urls_async(urls: list[str], output_dir: Path, verbose: bool,
     """Async function to handle URL downloads."""
     from boss_bot.core.downloads.clients.aio_gallery_dl import AsyncGalleryDL
     from boss_bot.core.downloads.clients.aio_yt_dlp import AsyncYtDlp
-    from boss_bot.core.env import BossSettings
 
-    settings = BossSettings()
-    success_count = 0
-    failed_count = 0
+    settings = get_settings()
+    # Downloads are network-bound, so run up to the configured number at once
+    semaphore = asyncio.Semaphore(max(1, settings.max_concurrent_downloads))
 
-    for i, url in enumerate(urls, 1):
-        cprint(f"\n[bold green]Processing URL {i}/{len(urls)}[/bold green]")
-        cprint(f"🔗 {url}")
+    # Determine which tool to use for each URL based on URL patterns
+    tools = [_determine_download_tool(url) for url in urls]
+    gallery_dl_client: AsyncGalleryDL | None = None
 
-        # Determine which tool to use based on URL patterns
-        tool, reason = _determine_download_tool(url)
+    async def process(i: int, url: str, tool: str, reason: str) -> bool | None:
+        async with semaphore:
+            cprint(f"\n[bold green]Processing URL {i}/{len(urls)}[/bold green]")
+            cprint(f"🔗 {url}")
 
-        if dry_run:
-            cprint(f"[yellow]Would use {tool}: {reason}[/yellow]")
-            continue
+            if dry_run:
+                cprint(f"[yellow]Would use {tool}: {reason}[/yellow]")
+                return None
 
-        cprint(f"🔧 Using {tool}: {reason}")
+            cprint(f"🔧 Using {tool}: {reason}")
 
-        try:
-            if tool == "yt-dlp":
-                async with AsyncYtDlp(output_dir=output_dir) as yt_dlp_client:
-                    success = await _download_with_ytdlp_api(yt_dlp_client, url, output_dir, verbose)
-            else:  # gallery-dl
-                async with AsyncGalleryDL(output_dir=output_dir) as gallery_dl_client:
+            try:
+                # Each yt-dlp URL gets its own short-lived client
+                if tool == "yt-dlp":
+                    async with AsyncYtDlp(output_dir=output_dir) as yt_dlp_client:
+                        success = await _download_with_ytdlp_api(yt_dlp_client, url, output_dir, verbose)
+                else:  # gallery-dl
                     success = await _download_with_gallery_dl_api(gallery_dl_client, url, output_dir, verbose)
 
-            if success:
-                success_count += 1
-                cprint(f"[green]✅ Successfully downloaded from {url}[/green]")
-            else:
-                failed_count += 1
-                cprint(f"[red]❌ Failed to download from {url}[/red]")
+                if success:
+                    cprint(f"[green]✅ Successfully downloaded from {url}[/green]")
+                else:
+                    cprint(f"[red]❌ Failed to download from {url}[/red]")
+                return success
 
-        except Exception as e:
-            failed_count += 1
-            cprint(f"[red]❌ Error downloading {url}: {e}[/red]")
-            if verbose:
-                import traceback
-
-                cprint(f"[dim red]{traceback.format_exc()}[/dim red]")
+            except Exception as e:
+                cprint(f"[red]❌ Error downloading {url}: {e}[/red]")
+                if verbose:
+                    cprint(f"[dim red]{traceback.format_exc()}[/dim red]")
+                return False
+
+    async with contextlib.AsyncExitStack() as stack:
+        # gallery-dl URLs share one client and its executor for the whole batch. They all pass the same
+        # options, so AsyncGalleryDL's config gate runs them concurrently on one global gallery-dl config
+        if not dry_run and any(tool == "gallery-dl" for tool, _ in tools):
+            gallery_dl_client = await stack.enter_async_context(AsyncGalleryDL(output_dir=output_dir))
+
+        results = await asyncio.gather(
+            *(process(i, url, tool, reason) for i, (url, (tool, reason)) in enumerate(zip(urls, tools, strict=True), 1))
+        )
+    success_count = results.count(True)
+    failed_count = results.count(False)
 
     # Summary
     cprint("\n[bold blue]Download Summary[/bold blue]")
@@ -486,6 +667,18 @@ async def _download_urls_async(urls: list[str], output_dir: Path, verbose: bool,
     cprint(f"📁 Files saved to: {output_dir.absolute()}")
 
 
+# Video platforms handled by yt-dlp, checked before the gallery-dl hosts
+_YTDLP_HOSTS_RE = re.compile(
+    r"youtube\.com|youtu\.be|youtube-nocookie\.com|twitch\.tv|vimeo\.com|dailymotion\.com|tiktok\.com"
+)
+
+# Platforms typically better handled by gallery-dl
+_GALLERY_DL_HOSTS_RE = re.compile(
+    r"twitter\.com|x\.com|instagram\.com|reddit\.com|imgur\.com|deviantart\.com|artstation\.com|pixiv\.net"
+    r"|danbooru\.donmai\.us|gelbooru\.com|pinterest\.com|tumblr\.com"
+)
+
+
 def _determine_download_tool(url: str) -> tuple[str, str]:
     """Determine which download tool to use based on URL patterns.
 
@@ -495,45 +688,13 @@ def _determine_download_tool(url: str) -> tuple[str, str]:
     Returns:
         Tuple of (tool_name, reason)
     """
-    import re
-
     url_lower = url.lower()
 
-    # YouTube and video platforms - use yt-dlp
-    youtube_patterns = [
-        r"youtube\.com",
-        r"youtu\.be",
-        r"youtube-nocookie\.com",
-        r"twitch\.tv",
-        r"vimeo\.com",
-        r"dailymotion\.com",
-        r"tiktok\.com",
-        r"vm\.tiktok\.com",
-    ]
-
-    for pattern in youtube_patterns:
-        if re.search(pattern, url_lower):
-            return "yt-dlp", f"Video platform detected ({pattern.replace(r'\.', '.')})"
-
-    # Platforms typically better handled by gallery-dl
-    gallery_dl_patterns = [
-        r"twitter\.com",
-        r"x\.com",
-        r"instagram\.com",
-        r"reddit\.com",
-        r"imgur\.com",
-        r"deviantart\.com",
-        r"artstation\.com",
-        r"pixiv\.net",
-        r"danbooru\.donmai\.us",
-        r"gelbooru\.com",
-        r"pinterest\.com",
-        r"tumblr\.com",
-    ]
+    if match := _YTDLP_HOSTS_RE.search(url_lower):
+        return "yt-dlp", f"Video platform detected ({match.group(0)})"
 
-    for pattern in gallery_dl_patterns:
-        if re.search(pattern, url_lower):
-            return "gallery-dl", f"Gallery platform detected ({pattern.replace(r'\.', '.')})"
+    if match := _GALLERY_DL_HOSTS_RE.search(url_lower):
+        return "gallery-dl", f"Gallery platform detected ({match.group(0)})"
 
     # Default to yt-dlp for unknown URLs as it has broader support
     return "yt-dlp", "Unknown platform, defaulting to yt-dlp"
@@ -579,8 +740,6 @@ async def _download_with_ytdlp_api(client: AsyncYtDlp, url: str, output_dir: Pat
     except Exception as e:
         cprint(f"[red]❌ yt-dlp API error: {e}[/red]")
         if verbose:
-            import traceback
-
             cprint(f"[dim red]{traceback.format_exc()}[/dim red]")
         return False
 
@@ -622,8 +781,6 @@ async def _download_with_gallery_dl_api(client: AsyncGalleryDL, url: str, output
     except Exception as e:
         cprint(f"[red]❌ gallery-dl API error: {e}[/red]")
         if verbose:
-            import traceback
-
             cprint(f"[dim red]{traceback.format_exc()}[/dim red]")
         return False
 
@@ -773,6 +930,21 @@ def _generate_ytdlp_command_equivalent(options: dict, url: str, output_dir: Path
     return " ".join(cmd_parts)
 
 
+# One named group per platform; the group that matched names the platform
+_PLATFORM_HOSTS_RE = re.compile(
+    r"(?P<twitter>twitter\.com|x\.com)"
+    r"|(?P<instagram>instagram\.com)"
+    r"|(?P<reddit>reddit\.com)"
+    r"|(?P<youtube>youtube\.com|youtu\.be)"
+    r"|(?P<tiktok>tiktok\.com)"
+    r"|(?P<imgur>imgur\.com)"
+    r"|(?P<tumblr>tumblr\.com)"
+    r"|(?P<pinterest>pinterest\.com)"
+    r"|(?P<deviantart>deviantart\.com)"
+    r"|(?P<pixiv>pixiv\.net)"
+)
+
+
 def _detect_platform_from_url(url: str) -> str | None:
     """Detect platform name from URL for configuration lookup.
 
@@ -782,33 +954,18 @@ def _detect_platform_from_url(url: str) -> str | None:
     Returns:
         Platform name or None if not detected
     """
-    import re
-
-    url_lower = url.lower()
-
-    platform_patterns = {
-        "twitter": [r"twitter\.com", r"x\.com"],
-        "instagram": [r"instagram\.com"],
-        "reddit": [r"reddit\.com"],
-        "youtube": [r"youtube\.com", r"youtu\.be"],
-        "tiktok": [r"tiktok\.com", r"vm\.tiktok\.com"],
-        "imgur": [r"imgur\.com"],
-        "tumblr": [r"tumblr\.com"],
-        "pinterest": [r"pinterest\.com"],
-        "deviantart": [r"deviantart\.com"],
-        "pixiv": [r"pixiv\.net"],
-    }
-
-    for platform, patterns in platform_patterns.items():
-        for pattern in patterns:
-            if re.search(pattern, url_lower):
-                return platform
-
-    return None
+    match = _PLATFORM_HOSTS_RE.search(url.lower())
+    return match.lastgroup if match else None
 
 
 def main():
-    load_commands()
+    # Plain `bossctl version` needs neither Typer's parser nor the rich console
+    if sys.argv[1:] == ["version"]:
+        print(f"boss_bot version: {__version__}")
+        return
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, handle_sigterm)
+    _ensure_commands_loaded()
     APP()
 
 
@@ -819,7 +976,9 @@ def entry():
 
 async def run_bot():
     """Run the Discord bot."""
-    settings = BossSettings()
+    from boss_bot.bot.client import BossBot
+
+    settings = get_settings()
     bot = BossBot(settings)
 
     try:
@@ -833,9 +992,6 @@ async def run_bot():
 @APP.command()
 def check_config() -> None:
     """Check and validate gallery-dl configuration using gallery-dl's config.load and GalleryDLConfig validation"""
-    import json
-    from pathlib import Path
-
     try:
         import gallery_dl.config
     except ImportError:
@@ -1039,9 +1195,6 @@ def _check_gallery_dl_config() -> bool:
     Returns:
         True if configuration is valid, False otherwise
     """
-    import json
-    from pathlib import Path
-
     # Define possible config locations in order of precedence
     gallery_dl_configs = [
         Path.cwd() / "gallery-dl.conf",
@@ -1068,7 +1221,7 @@ def _check_gallery_dl_config() -> bool:
 
                 # Try to parse as JSON
                 try:
-                    config_data = json.loads(config_content)
+                    config_data = _json_loads(config_content)
 
                     # Basic validation checks
                     if not isinstance(config_data, dict):
@@ -1135,11 +1288,8 @@ def setup_config(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be changed without making modifications"),
 ) -> None:
     """Create a dummy gallery-dl configuration file at ~/.gallery-dl.conf"""
-    import difflib
-    import json
     import shutil
     from datetime import datetime
-    from pathlib import Path
 
     config_path = Path.home() / ".gallery-dl.conf"
 
@@ -1504,8 +1654,6 @@ def _show_new_config_preview(new_config: str, config_path: Path) -> None:
 
     # Show key configuration sections
     try:
-        import json
-
         config_data = json.loads(new_config)
 
         cprint("\n[bold blue]Configuration Sections:[/bold blue]")
@@ -1649,7 +1797,7 @@ def print_exceptionhook(
 def go() -> None:
     """Main entry point for BossAI"""
     typer.echo("Starting up BossAI Bot")
-    asyncio.run(run_bot())
+    asyncio.run(run_bot(), loop_factory=loop_factory())
 
 
 def handle_sigterm(signo: int, frame: FrameType | None) -> NoReturn:
@@ -1665,7 +1813,5 @@ def handle_sigterm(signo: int, frame: FrameType | None) -> NoReturn:
     sys.exit(128 + signo)  # this will raise SystemExit and cause atexit to be called
 
 
-signal.signal(signal.SIGTERM, handle_sigterm)
-
 if __name__ == "__main__":
-    APP()
+    main()
@@ -0,0 +1,62 @@
+"""Event loop helpers for CLI entry points."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import sys
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+# libuv-backed event loop (optional `uvloop` extra, not available on Windows)
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+T = TypeVar("T")
+
+
+def loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get the event loop factory CLI commands should pass to ``asyncio.run``.
+
+    Returns:
+        ``uvloop.new_event_loop`` when uvloop is installed on a supported platform,
+        otherwise None so asyncio uses its default loop
+    """
+    return uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+
+
+# Process-wide runner so sequential CLI coroutines share one event loop
+_runner: asyncio.Runner | None = None
+
+
+def get_runner() -> asyncio.Runner:
+    """Get or create the process-wide runner, closed automatically at interpreter exit.
+
+    Returns:
+        Runner backed by uvloop when available, otherwise by a default asyncio loop
+    """
+    global _runner
+    if _runner is None:
+        # An explicit factory keeps the runner from installing its loop as the thread default
+        _runner = asyncio.Runner(loop_factory=loop_factory() or asyncio.new_event_loop)
+        atexit.register(_runner.close)
+    return _runner
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the shared CLI event loop.
+
+    Unlike ``asyncio.run`` the loop is kept open between calls, so commands that
+    run several coroutines in sequence only pay loop setup once.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    return get_runner().run(coro)
@@ -1,5 +1,24 @@
 """Downloads management module."""
 
-from .manager import DownloadManager
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .manager import DownloadManager
 
 __all__ = ["DownloadManager"]
+
+
+def __getattr__(name: str):
+    """Import DownloadManager on first access.
+
+    The manager pulls in the storage layer, which the download CLI commands never
+    use; deferring it keeps ``bossctl download`` startup to the feature flags and
+    strategies it actually needs.
+    """
+    if name == "DownloadManager":
+        from .manager import DownloadManager
+
+        return DownloadManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
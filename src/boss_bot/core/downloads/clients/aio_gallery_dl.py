@@ -17,23 +17,182 @@ running them in a thread pool to avoid blocking the event loop.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import copy
+import functools
 import json
 import logging
+import os
+import re
 import sys
 import tempfile
+import threading
 import traceback
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import aiofiles
-
 from boss_bot.core.downloads.clients.aio_gallery_dl_utils import get_default_gallery_dl_config_locations
 from boss_bot.core.downloads.clients.config import GalleryDLConfig
 
 logger = logging.getLogger(__name__)
 
+# gallery-dl work is network-bound, so size the pool well past the core count
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+@functools.cache
+def _shared_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Get the process-wide gallery-dl thread pool of the given size.
+
+    Pools are created on first use and kept for the life of the process, so
+    clients entering and leaving ``async with`` reuse warm worker threads.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gallery-dl")
+
+
+# Config file paths -> (file stamps, config loaded from them by gallery-dl)
+_LOADED_CONFIG_CACHE: dict[tuple[str, ...], tuple[tuple[tuple[int, int] | None, ...], dict[str, Any]]] = {}
+
+
+def _file_stamps(paths: tuple[str, ...]) -> tuple[tuple[int, int] | None, ...]:
+    """Get the ``(mtime_ns, size)`` of each path, or None for paths that do not exist."""
+    stamps = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamps.append(None)
+        else:
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+class _ConfigGate:
+    """Coordinates threads using gallery-dl's process-wide configuration.
+
+    gallery-dl keeps its options in one module-level dict that a running job keeps
+    reading. Calls that need the same configuration run together on it; a call that
+    needs a different one waits until the running calls have finished before the
+    dict is cleared and refilled, so no job ever sees another call's options.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._applied: dict[str, Any] | None = None
+        self._active = 0
+        self._swaps_pending = 0
+
+    def _acquire(self, config: dict[str, Any] | None) -> None:
+        with self._condition:
+            if self._applied == config and config is not None and self._swaps_pending == 0:
+                self._active += 1
+                return
+            # Queue behind the running calls; later arrivals sharing the applied config wait too
+            self._swaps_pending += 1
+            self._condition.wait_for(lambda: self._active == 0)
+            self._swaps_pending -= 1
+            self._active += 1
+            if config is None:
+                # The caller rewrites the config itself
+                self._applied = None
+            elif self._applied != config:
+                from gallery_dl import config as gdl_config
+                from gallery_dl import util
+
+                gdl_config.clear()
+                util.combine_dict(gdl_config._config, copy.deepcopy(config))
+                self._applied = copy.deepcopy(config)
+
+    def _release(self) -> None:
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def use(self, config: dict[str, Any]) -> Iterator[None]:
+        """Run the block with ``config`` loaded into gallery-dl's global configuration."""
+        self._acquire(config)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @contextlib.contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Run the block alone, for code that loads gallery-dl's global configuration directly."""
+        self._acquire(None)
+        try:
+            yield
+        finally:
+            self._release()
+
+
+_CONFIG_GATE = _ConfigGate()
+
+
+# Errors that mean the remote site wants us to slow down
+_THROTTLED_RE = re.compile(r"\b(?:429|5\d\d)\b|too many requests|rate.?limit", re.IGNORECASE)
+
+# Platform names accepted by supports_platform (compared lowercase)
+_SUPPORTED_PLATFORMS = frozenset(
+    {
+        "twitter",
+        "reddit",
+        "instagram",
+        "youtube",
+        "tiktok",
+        "imgur",
+        "flickr",
+        "deviantart",
+        "artstation",
+        "pixiv",
+    }
+)
+
+
+# Items a worker thread may buffer ahead of a slow consumer when streaming results
+_STREAM_QUEUE_SIZE = 64
+
+# Marks the end of a streamed result queue
+_STREAM_DONE = object()
+
+
+class _StreamClosed(Exception):
+    """Raised in the worker thread once the consumer has stopped reading a result stream."""
+
+
+class _AdaptiveLimit:
+    """Additive-increase/multiplicative-decrease cap on concurrent calls.
+
+    The cap starts at ``limit``. It halves when a call fails with a throttling or
+    server error and grows back by one after each call that succeeds, so a client
+    backs off a struggling site and recovers once requests go through again.
+    """
+
+    def __init__(self, limit: int):
+        self.max_limit = limit
+        self.limit = limit
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        async with self._condition:
+            self._active -= 1
+            if exc_val is not None:
+                if _THROTTLED_RE.search(str(exc_val)):
+                    self.limit = max(1, self.limit // 2)
+                    logger.debug(f"gallery-dl throttled, concurrency limit lowered to {self.limit}")
+            elif self.limit < self.max_limit:
+                self.limit += 1
+            self._condition.notify_all()
+
 
 class AsyncGalleryDL:
     """Asynchronous wrapper around gallery-dl.
@@ -55,6 +214,7 @@ class AsyncGalleryDL:
         cookies_from_browser: str | None = "Firefox",
         download_dir: Path | None = None,
         mtime: bool = False,
+        max_workers: int | None = None,
         **kwargs: Any,
     ):
         """Initialize AsyncGalleryDL client.
@@ -65,14 +225,19 @@ class AsyncGalleryDL:
             cookies_file: Path to Netscape cookies file
             cookies_from_browser: Browser name to extract cookies from
             download_dir: Directory for downloads
+            max_workers: Size of the thread pool running gallery-dl calls (default: DEFAULT_MAX_WORKERS)
             **kwargs: Additional configuration options
         """
         self.config = config or {}
         self.config_file = config_file or Path("~/.gallery-dl.conf").expanduser()
         self.download_dir = download_dir or Path("./downloads")
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
         self._executor: ThreadPoolExecutor | None = None
+        self._limit = _AdaptiveLimit(self.max_workers)
         self._gallery_dl_config: GalleryDLConfig | None = None
         self._gdl_config: dict[str, Any] = {}  # Store gallery-dl's loaded config
+        self._enter_count = 0  # Active ``async with`` entries sharing the executor
+        self._config_loaded: asyncio.Future[None] | None = None
 
         # Apply cookie settings
         if cookies_file:
@@ -89,15 +254,28 @@ class AsyncGalleryDL:
             self.config.update(kwargs)
 
     async def __aenter__(self) -> AsyncGalleryDL:
-        """Async context manager entry."""
-        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gallery-dl")
-        await self._load_configuration()
+        """Async context manager entry.
+
+        The context is re-entrant: nested or concurrent entries share one configuration
+        load, which is released when the last entry exits. The thread pool is shared by
+        every client with the same ``max_workers`` and is never shut down here.
+        """
+        self._enter_count += 1
+        if self._enter_count == 1:
+            self._executor = _shared_executor(self.max_workers)
+            self._config_loaded = asyncio.ensure_future(self._load_configuration())
+        try:
+            await asyncio.shield(self._config_loaded)
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit."""
-        if self._executor:
-            self._executor.shutdown(wait=True)
+        self._enter_count -= 1
+        if self._enter_count == 0:
+            self._executor = None
 
     async def _load_configuration(self) -> None:
         """Load and merge configuration using gallery-dl's native config loading."""
@@ -107,20 +285,35 @@ class AsyncGalleryDL:
             try:
                 from gallery_dl import config as gdl_config
 
-                # Clear any existing configuration to ensure clean state
-                gdl_config.clear()
-
                 # Load from default locations (similar to gallery-dl's behavior)
                 config_files = None
                 if self.config_file and self.config_file.exists():
                     # If we have a specific config file, use it
                     config_files = [str(self.config_file)]
 
-                # Load configuration using gallery-dl's native loader
-                gdl_config.load(files=config_files)
+                # Reuse the last load of these files unless one of them changed on disk
+                default_configs = getattr(gdl_config, "_default_configs", None) or map(
+                    str, get_default_gallery_dl_config_locations()
+                )
+                paths = tuple(
+                    config_files or (os.path.expandvars(os.path.expanduser(path)) for path in default_configs)
+                )
+                stamps = _file_stamps(paths)
+                cached = _LOADED_CONFIG_CACHE.get(paths)
+                if cached is not None and cached[0] == stamps:
+                    base_config = cached[1]
+                else:
+                    with _CONFIG_GATE.exclusive():
+                        # Clear any existing configuration to ensure clean state
+                        gdl_config.clear()
+
+                        # Load configuration using gallery-dl's native loader
+                        gdl_config.load(files=config_files)
+                        base_config = copy.deepcopy(gdl_config._config) if gdl_config._config else {}
+                    _LOADED_CONFIG_CACHE[paths] = (stamps, base_config)
 
-                # Get the loaded configuration
-                loaded_config = gdl_config._config.copy() if gdl_config._config else {}
+                # Get the loaded configuration; merging below mutates nested dicts, so never hand out the cached one
+                loaded_config = copy.deepcopy(base_config)
 
                 logger.debug(f"loaded_config: {loaded_config}")
 
@@ -156,8 +349,7 @@ class AsyncGalleryDL:
             if not self._executor:
                 raise RuntimeError("AsyncGalleryDL not initialized properly")
 
-            loop = asyncio.get_event_loop()
-            self._gdl_config = await loop.run_in_executor(self._executor, _load_config_sync)
+            self._gdl_config = await asyncio.get_running_loop().run_in_executor(self._executor, _load_config_sync)
 
             # Update self.config with the final merged configuration from _gdl_config
             if self._gdl_config:
@@ -187,6 +379,50 @@ class AsyncGalleryDL:
             self.config = self._gdl_config.copy()
             logger.debug(f"Updated self.config with fallback configuration: {self.config}")
 
+    async def _run_limited(self, func: Callable[[], Any]) -> Any:
+        """Run a network-bound gallery-dl call in the executor under the adaptive concurrency limit."""
+        async with self._limit:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+    async def _stream_limited(
+        self, func: Callable[[Callable[[dict[str, Any]], None]], None]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Run a gallery-dl call in the executor and yield the items it emits as they arrive.
+
+        ``func`` runs in a worker thread and is passed an ``emit`` callback that hands each
+        item to the event loop through a bounded queue, so callers see the first result
+        without waiting for the whole gallery and the worker never buffers more than
+        ``_STREAM_QUEUE_SIZE`` items ahead of them.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+        closed = threading.Event()
+
+        def emit(item: dict[str, Any]) -> None:
+            if closed.is_set():
+                raise _StreamClosed("Result stream closed by consumer")
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def run() -> None:
+            try:
+                func(emit)
+            finally:
+                asyncio.run_coroutine_threadsafe(queue.put(_STREAM_DONE), loop)
+
+        async with self._limit:
+            future = loop.run_in_executor(self._executor, run)
+            try:
+                while (item := await queue.get()) is not _STREAM_DONE:
+                    yield item
+                await future
+            finally:
+                if not future.done():
+                    # Unblock a worker waiting on a full queue so it can see the stream is closed
+                    closed.set()
+                    while not queue.empty():
+                        queue.get_nowait()
+                    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
     def _get_effective_config(self) -> dict[str, Any]:
         """Get the effective configuration dictionary."""
         # Return the gallery-dl native config if available
@@ -198,6 +434,16 @@ class AsyncGalleryDL:
         # Final fallback to instance config
         return self.config
 
+    def _call_config(self, options: dict[str, Any]) -> dict[str, Any]:
+        """Get the effective configuration with per-call options merged into ``extractor``.
+
+        The client's own configuration is left untouched, so options never leak into later calls.
+        """
+        config = self._get_effective_config()
+        if not options:
+            return config
+        return {**config, "extractor": {**config.get("extractor", {}), **options}}
+
     async def extract_metadata(self, url: str, **options: Any) -> AsyncIterator[dict[str, Any]]:
         """Extract metadata from a URL asynchronously.
 
@@ -209,51 +455,29 @@ class AsyncGalleryDL:
             Metadata dictionaries for each item found
         """
 
-        def _extract_metadata_sync() -> list[dict[str, Any]]:
+        def _extract_metadata_sync(emit: Callable[[dict[str, Any]], None]) -> None:
             """Synchronous metadata extraction."""
             try:
                 import gallery_dl
-                from gallery_dl import config as gdl_config
                 from gallery_dl import extractor
 
-                # Apply configuration in a thread-safe way
-                effective_config = self._get_effective_config().copy()
-
-                # Merge additional options into config before loading
-                if options:
-                    # Merge options into the effective config copy
-                    if "extractor" not in effective_config:
-                        effective_config["extractor"] = {}
-                    effective_config["extractor"].update(options)
-
-                # Clear and load configuration for this thread
-                gdl_config.clear()
-
-                # Load using the config dict directly instead of files
-                # This is safer for thread isolation
-                if effective_config:
-                    # Use gallery-dl's internal combine_dict to merge into the global config
-                    from gallery_dl import util
-
-                    util.combine_dict(gdl_config._config, effective_config)
-
-                # Find and create extractor
-                extr = extractor.find(url)
-                if not extr:
-                    raise ValueError(f"No extractor found for URL: {url}")
+                # gallery-dl reads the global config for the whole extraction
+                with _CONFIG_GATE.use(self._call_config(options)):
+                    # Find and create extractor
+                    extr = extractor.find(url)
+                    if not extr:
+                        raise ValueError(f"No extractor found for URL: {url}")
 
-                # Extract metadata
-                metadata_list = []
-                for msg in extr:
-                    if msg[0] == "url":
-                        # URL message: (type, url_info)
-                        url_info = msg[1]
-                        metadata_list.append(url_info)
-
-                return metadata_list
+                    # Extract metadata, handing each item over as soon as it is found
+                    for msg in extr:
+                        if msg[0] == "url":
+                            # URL message: (type, url_info)
+                            emit(msg[1])
 
             except ImportError as e:
                 raise RuntimeError(f"gallery-dl is not available: {e}") from e
+            except _StreamClosed:
+                raise
             except Exception as e:
                 logger.error(f"Error extracting metadata from {url}: {e}")
                 raise
@@ -262,11 +486,7 @@ class AsyncGalleryDL:
         if not self._executor:
             raise RuntimeError("AsyncGalleryDL not initialized. Use 'async with' context manager.")
 
-        loop = asyncio.get_event_loop()
-        metadata_list = await loop.run_in_executor(self._executor, _extract_metadata_sync)
-
-        # Yield each metadata item
-        for metadata in metadata_list:
+        async for metadata in self._stream_limited(_extract_metadata_sync):
             yield metadata
 
     async def download(self, url: str, **options: Any) -> AsyncIterator[dict[str, Any]]:
@@ -280,81 +500,64 @@ class AsyncGalleryDL:
             Download result dictionaries for each item
         """
 
-        def _download_sync() -> list[dict[str, Any]]:
+        def _download_sync(emit: Callable[[dict[str, Any]], None]) -> None:
             """Synchronous download operation."""
             try:
                 import gallery_dl
-                from gallery_dl import config as gdl_config
                 from gallery_dl import job
 
-                # Apply configuration in a thread-safe way
-                effective_config = self._get_effective_config().copy()
-
-                # Merge additional options into config before loading
-                if options:
-                    # Merge options into the effective config copy
-                    if "extractor" not in effective_config:
-                        effective_config["extractor"] = {}
-                    effective_config["extractor"].update(options)
-
-                # Clear and load configuration for this thread
-                gdl_config.clear()
-
-                # Load using the config dict directly instead of files
-                # This is safer for thread isolation
-                if effective_config:
-                    # Use gallery-dl's internal combine_dict to merge into the global config
-                    from gallery_dl import util
-
-                    util.combine_dict(gdl_config._config, effective_config)
-
-                # Ensure download directory exists
-                self.download_dir.mkdir(parents=True, exist_ok=True)
-
-                # Create download job
-                download_job = job.DownloadJob(url)
-
-                # Collect results
-                results = []
-
-                # Hook into job to capture results
-                original_handle_url = download_job.handle_url
-
-                def capture_url_result(url_tuple, kwdict):
-                    """Capture URL processing results."""
-                    try:
-                        result = original_handle_url(url_tuple, kwdict)
-                        # Convert result to serializable format
-                        if hasattr(url_tuple, "__dict__"):
-                            result_dict = dict(url_tuple.__dict__)
-                        else:
-                            result_dict = {
-                                "url": getattr(url_tuple, "url", str(url_tuple)),
-                                "filename": getattr(url_tuple, "filename", None),
-                                "extension": getattr(url_tuple, "extension", None),
-                            }
-                        results.append(result_dict)
-                        return result
-                    except Exception as e:
-                        logger.error(f"Error processing URL: {e}")
-                        results.append(
-                            {
-                                "url": str(url_tuple),
-                                "error": str(e),
-                                "success": False,
-                            }
-                        )
-                        raise
-
-                download_job.handle_url = capture_url_result
-
-                # Run the download job
-                download_job.run()
-
-                return results
+                # gallery-dl reads the global config for the whole job
+                with _CONFIG_GATE.use(self._call_config(options)):
+                    # Ensure download directory exists
+                    self.download_dir.mkdir(parents=True, exist_ok=True)
+
+                    # Create download job
+                    download_job = job.DownloadJob(url)
+
+                    # Hook into job to capture results
+                    original_handle_url = download_job.handle_url
+
+                    def capture_url_result(url_tuple, kwdict):
+                        """Capture URL processing results."""
+                        try:
+                            result = original_handle_url(url_tuple, kwdict)
+                            # Convert result to serializable format
+                            if hasattr(url_tuple, "__dict__"):
+                                result_dict = dict(url_tuple.__dict__)
+                            else:
+                                result_dict = {
+                                    "url": getattr(url_tuple, "url", str(url_tuple)),
+                                    "filename": getattr(url_tuple, "filename", None),
+                                    "extension": getattr(url_tuple, "extension", None),
+                                }
+                            # Local path the file was just saved to
+                            path = getattr(getattr(download_job, "pathfmt", None), "path", None)
+                            if path:
+                                result_dict["path"] = str(path)
+                            emit(result_dict)
+                            return result
+                        except _StreamClosed:
+                            raise
+                        except Exception as e:
+                            logger.error(f"Error processing URL: {e}")
+                            emit(
+                                {
+                                    "url": str(url_tuple),
+                                    "error": str(e),
+                                    "success": False,
+                                }
+                            )
+                            raise
+
+                    download_job.handle_url = capture_url_result
+
+                    # Run the download job
+                    download_job.run()
 
             except ImportError as e:
                 raise RuntimeError(f"gallery-dl is not available: {e}") from e
+            except _StreamClosed:
+                raise
             except Exception as e:
                 logger.error(f"Error downloading from {url}: {e}")
                 print(f"{e}")
@@ -371,11 +574,7 @@ class AsyncGalleryDL:
         if not self._executor:
             raise RuntimeError("AsyncGalleryDL not initialized. Use 'async with' context manager.")
 
-        loop = asyncio.get_event_loop()
-        results = await loop.run_in_executor(self._executor, _download_sync)
-
-        # Yield each result
-        for result in results:
+        async for result in self._stream_limited(_download_sync):
             yield result
 
     async def get_extractors(self) -> list[str]:
@@ -410,8 +609,7 @@ class AsyncGalleryDL:
         if not self._executor:
             raise RuntimeError("AsyncGalleryDL not initialized. Use 'async with' context manager.")
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, _get_extractors_sync)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, _get_extractors_sync)
 
     async def test_url(self, url: str) -> bool:
         """Test if URL is supported by any extractor.
@@ -438,8 +636,7 @@ class AsyncGalleryDL:
         if not self._executor:
             raise RuntimeError("AsyncGalleryDL not initialized. Use 'async with' context manager.")
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, _test_url_sync)
+        return await self._run_limited(_test_url_sync)
 
     def supports_platform(self, platform: str) -> bool:
         """Check if platform is supported.
@@ -450,19 +647,7 @@ class AsyncGalleryDL:
         Returns:
             True if platform is supported
         """
-        supported_platforms = {
-            "twitter",
-            "reddit",
-            "instagram",
-            "youtube",
-            "tiktok",
-            "imgur",
-            "flickr",
-            "deviantart",
-            "artstation",
-            "pixiv",
-        }
-        return platform.lower() in supported_platforms
+        return platform.lower() in _SUPPORTED_PLATFORMS
 
     @property
     def config_dict(self) -> dict[str, Any]:
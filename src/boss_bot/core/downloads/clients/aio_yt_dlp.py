@@ -6,6 +6,7 @@ import asyncio
 import json
 import logging
 import tempfile
+import threading
 from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -45,6 +46,10 @@ class AsyncYtDlp:
         self.output_dir = output_dir
         self.extra_options = kwargs
         self._yt_dlp = None
+        self._options: dict[str, Any] = {}
+        # YoutubeDL instances for per-call option sets, keyed by the serialized options
+        self._yt_dlp_by_options: dict[str, Any] = {}
+        self._yt_dlp_by_options_lock = threading.Lock()
 
     async def __aenter__(self) -> AsyncYtDlp:
         """Async context manager entry."""
@@ -95,6 +100,7 @@ class AsyncYtDlp:
         options.update(self.extra_options)
 
         # Create yt-dlp instance
+        self._options = options
         self._yt_dlp = yt_dlp.YoutubeDL(options)
 
     async def _cleanup(self) -> None:
@@ -104,9 +110,29 @@ class AsyncYtDlp:
             await loop.run_in_executor(None, self._close_yt_dlp)
 
     def _close_yt_dlp(self) -> None:
-        """Close yt-dlp instance (runs in thread pool)."""
-        if hasattr(self._yt_dlp, "close"):
-            self._yt_dlp.close()
+        """Close yt-dlp instances (runs in thread pool)."""
+        with self._yt_dlp_by_options_lock:
+            instances = [self._yt_dlp, *self._yt_dlp_by_options.values()]
+            self._yt_dlp_by_options.clear()
+        for instance in instances:
+            if hasattr(instance, "close"):
+                instance.close()
+
+    def _yt_dlp_for_options_sync(self, options: dict[str, Any]) -> Any:
+        """Get a YoutubeDL built with per-call options on top of the client's (runs in thread pool).
+
+        The shared instance's params are never modified, so concurrent downloads with
+        different options cannot pick up each other's format or output template.
+        """
+        key = json.dumps(options, sort_keys=True, default=str)
+        with self._yt_dlp_by_options_lock:
+            instance = self._yt_dlp_by_options.get(key)
+            if instance is None:
+                import yt_dlp
+
+                instance = yt_dlp.YoutubeDL({**self._options, **options})
+                self._yt_dlp_by_options[key] = instance
+            return instance
 
     async def extract_info(self, url: str, download: bool = True) -> dict[str, Any]:
         """Extract information from URL.
@@ -124,10 +150,18 @@ class AsyncYtDlp:
         if not self._yt_dlp:
             raise RuntimeError("AsyncYtDlp not initialized. Use async context manager.")
 
+        return await self._extract_info_with(self._yt_dlp, url, download)
+
+    async def _extract_info_with(self, instance: Any, url: str, download: bool) -> dict[str, Any]:
+        """Extract information from URL with the given YoutubeDL instance.
+
+        Raises:
+            RuntimeError: If extraction fails or returns None
+        """
         loop = asyncio.get_event_loop()
 
         try:
-            result = await loop.run_in_executor(None, self._extract_info_sync, url, download)
+            result = await loop.run_in_executor(None, self._extract_info_sync, instance, url, download)
             if result is None:
                 raise RuntimeError(f"yt-dlp extraction returned None for URL: {url}")
             return result
@@ -135,9 +169,9 @@ class AsyncYtDlp:
             logger.error(f"Failed to extract info from {url}: {e}")
             raise RuntimeError(f"yt-dlp extraction failed: {e}") from e
 
-    def _extract_info_sync(self, url: str, download: bool) -> dict[str, Any] | None:
+    def _extract_info_sync(self, instance: Any, url: str, download: bool) -> dict[str, Any] | None:
         """Synchronous info extraction (runs in thread pool)."""
-        return self._yt_dlp.extract_info(url, download=download)
+        return instance.extract_info(url, download=download)
 
     async def download(self, url: str, **options) -> AsyncIterator[dict[str, Any]]:
         """Download video from URL.
@@ -152,10 +186,8 @@ class AsyncYtDlp:
         if not self._yt_dlp:
             raise RuntimeError("AsyncYtDlp not initialized. Use async context manager.")
 
-        # Update options for this download
+        instance = self._yt_dlp
         if options:
-            original_params = self._yt_dlp.params.copy()
-
             # Handle outtmpl option specially to avoid conflicts
             processed_options = options.copy()
             if "outtmpl" in processed_options:
@@ -164,29 +196,24 @@ class AsyncYtDlp:
                     # Convert string outtmpl to dict format expected by yt-dlp
                     processed_options["outtmpl"] = {"default": outtmpl_value}
 
-            self._yt_dlp.params.update(processed_options)
-
-        try:
-            # Extract info and download
-            info = await self.extract_info(url, download=True)
-
-            # Yield the result
-            yield {
-                "extractor": "youtube",
-                "url": url,
-                "info": info,
-                "title": info.get("title", ""),
-                "uploader": info.get("uploader", ""),
-                "duration": info.get("duration"),
-                "view_count": info.get("view_count"),
-                "like_count": info.get("like_count"),
-                "filename": info.get("_filename", ""),
-            }
-
-        finally:
-            # Restore original options
-            if options:
-                self._yt_dlp.params = original_params
+            loop = asyncio.get_event_loop()
+            instance = await loop.run_in_executor(None, self._yt_dlp_for_options_sync, processed_options)
+
+        # Extract info and download
+        info = await self._extract_info_with(instance, url, download=True)
+
+        # Yield the result
+        yield {
+            "extractor": "youtube",
+            "url": url,
+            "info": info,
+            "title": info.get("title", ""),
+            "uploader": info.get("uploader", ""),
+            "duration": info.get("duration"),
+            "view_count": info.get("view_count"),
+            "like_count": info.get("like_count"),
+            "filename": info.get("_filename", ""),
+        }
 
     async def extract_metadata(self, url: str) -> AsyncIterator[dict[str, Any]]:
         """Extract metadata without downloading.
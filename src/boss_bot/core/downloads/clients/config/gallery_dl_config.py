@@ -12,6 +12,13 @@ from pydantic import BaseModel, Field, SecretStr, field_validator
 
 from boss_bot.core.downloads.clients.aio_gallery_dl_utils import get_default_gallery_dl_config_locations
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # logger = logging.getLogger(__name__)
 
 
@@ -256,15 +263,15 @@ class GalleryDLConfig(BaseModel):
                 return cls()
 
         try:
-            with open(config_path, encoding="utf-8") as f:
-                content = f.read().strip()
+            content = config_path.read_bytes().strip()
 
             if not content:
                 logger.warning(f"Configuration file is empty: {config_path}. Using defaults.")
                 return cls()
 
             try:
-                config_data = json.loads(content)
+                # orjson's decode error subclasses json.JSONDecodeError
+                config_data = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON in configuration file {config_path}: {e}") from e
 
@@ -290,20 +297,18 @@ class GalleryDLConfig(BaseModel):
         return self.from_dict(merged_dict)
 
     def _deep_merge(self, base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-        """Deep merge two dictionaries with override taking precedence."""
-        import copy
-
-        merged = copy.deepcopy(base)
+        """Deep merge two dictionaries with override taking precedence.
 
-        def merge_recursive(base_dict: dict[str, Any], override_dict: dict[str, Any]) -> dict[str, Any]:
-            for key, value in override_dict.items():
-                if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                    base_dict[key] = merge_recursive(base_dict[key], value)
-                else:
-                    base_dict[key] = value
-            return base_dict
-
-        return merge_recursive(merged, override)
+        Only the dicts along overridden paths are copied; neither input is modified.
+        """
+        merged = dict(base)
+        for key, value in override.items():
+            base_value = merged.get(key)
+            if isinstance(base_value, dict) and isinstance(value, dict):
+                merged[key] = self._deep_merge(base_value, value)
+            else:
+                merged[key] = value
+        return merged
 
     class Config:
         """Pydantic configuration."""
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import abc
+import logging
+from collections.abc import AsyncIterator
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict
 
 if TYPE_CHECKING:
     from boss_bot.core.downloads.handlers.base_handler import DownloadResult, MediaMetadata
 
+logger = logging.getLogger(__name__)
+
 
 class BaseDownloadStrategy(abc.ABC):
     """Strategy interface for choosing download implementation.
@@ -42,6 +46,99 @@ class BaseDownloadStrategy(abc.ABC):
         """
         pass
 
+    async def download_iter(self, url: str, **kwargs: Any) -> AsyncIterator[tuple[str, MediaMetadata]]:
+        """Stream downloaded files as they become available.
+
+        The default implementation waits for :meth:`download` to finish and then
+        yields each file. Strategies that can observe files progressively should
+        override this so callers can report progress while the download runs.
+
+        Args:
+            url: URL to download from
+            **kwargs: Additional download options
+
+        Yields:
+            Tuples of (file_path, partial_metadata); the last metadata is the final result
+        """
+        metadata = await self.download(url, **kwargs)
+        for file_path in metadata.files or []:
+            yield file_path, metadata
+
+    async def _iter_api_files(
+        self, api_client: Any, convert: Callable[[dict[str, Any], str], MediaMetadata], url: str, **kwargs: Any
+    ) -> AsyncIterator[tuple[str, MediaMetadata]]:
+        """Yield each file an API client saves, as soon as it is saved.
+
+        Args:
+            api_client: Client whose ``download()`` streams result dicts with a ``path`` for each saved file
+            convert: Converts one result dict and the URL to MediaMetadata
+            url: URL to download from
+            **kwargs: Additional download options
+
+        Yields:
+            Tuples of (file_path, metadata); ``metadata.files`` lists every file saved so far
+
+        Raises:
+            RuntimeError: If the download saved no files
+        """
+        files: list[str] = []
+        async with api_client as client:
+            async for result in client.download(url, **kwargs):
+                path = result.get("path")
+                if not path:
+                    continue
+                files.append(path)
+                metadata = convert(result, url)
+                metadata.files = list(files)
+                yield path, metadata
+        if not files:
+            raise RuntimeError(f"No content downloaded from {url}")
+
+    async def _stream_download(
+        self, url: str, use_api: bool, **kwargs: Any
+    ) -> AsyncIterator[tuple[str, MediaMetadata]]:
+        """Stream downloaded files for a strategy backed by a gallery-dl API client.
+
+        CLI mode only learns the files once the subprocess exits, so it uses the default
+        ``download_iter``. An API failure falls back to the CLI only if no file was streamed yet.
+
+        Args:
+            url: URL to download from
+            use_api: The strategy's API-direct feature flag
+            **kwargs: Additional download options
+
+        Yields:
+            Tuples of (file_path, partial_metadata); the last metadata is the final result
+
+        Raises:
+            ValueError: If URL is not supported
+            RuntimeError: If download fails and no fallback is available
+        """
+        if not use_api:
+            async for item in BaseDownloadStrategy.download_iter(self, url, **kwargs):
+                yield item
+            return
+
+        if not self.supports_url(url):
+            raise ValueError(f"URL not supported by {self.platform_name.capitalize()} strategy: {url}")
+
+        streamed = False
+        try:
+            logger.info(f"Using API-direct approach for streaming {self.platform_name} download: {url}")
+            async for item in self._iter_api_files(
+                self.api_client, self._convert_api_response_to_metadata, url, **kwargs
+            ):
+                streamed = True
+                yield item
+        except Exception as e:
+            if streamed or not self.feature_flags.api_fallback_to_cli:
+                logger.error(f"API download failed with no fallback: {e}")
+                raise
+            logger.warning(f"API download failed, falling back to CLI: {e}")
+            metadata = await self._download_via_cli(url, **kwargs)
+            for file_path in metadata.files or []:
+                yield file_path, metadata
+
     @abc.abstractmethod
     async def get_metadata(self, url: str, **kwargs: Any) -> MediaMetadata:
         """Get metadata using chosen strategy (CLI or API).
@@ -71,6 +168,13 @@ class BaseDownloadStrategy(abc.ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Release any clients the strategy keeps open between downloads.
+
+        The default implementation holds nothing open and does nothing.
+        """
+        return None
+
     @property
     @abc.abstractmethod
     def platform_name(self) -> str:
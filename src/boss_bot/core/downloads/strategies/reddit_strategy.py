@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -139,6 +140,19 @@ class RedditDownloadStrategy(BaseDownloadStrategy):
             logger.info(f"Using CLI approach for Reddit download: {url}")
             return await self._download_via_cli(url, **kwargs)
 
+    async def download_iter(self, url: str, **kwargs: Any) -> AsyncIterator[tuple[str, MediaMetadata]]:
+        """Stream downloaded files as gallery-dl saves them in API-direct mode.
+
+        Args:
+            url: Reddit URL to download from
+            **kwargs: Additional download options
+
+        Yields:
+            Tuples of (file_path, partial_metadata); the last metadata is the final result
+        """
+        async for item in self._stream_download(url, self.feature_flags.use_api_reddit, **kwargs):
+            yield item
+
     async def get_metadata(self, url: str, **kwargs: Any) -> MediaMetadata:
         """Get metadata using feature-flagged approach.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import re
@@ -21,6 +22,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# yt-dlp format selectors for the quality names accepted by the download command
+_QUALITY_FORMATS: dict[str, str] = {
+    "best": "best",
+    "worst": "worst",
+    "4K": "best[height<=2160]",
+    "2160p": "best[height<=2160]",
+    "1440p": "best[height<=1440]",
+    "2K": "best[height<=1440]",
+    "1080p": "best[height<=1080]",
+    "FHD": "best[height<=1080]",
+    "720p": "best[height<=720]",
+    "HD": "best[height<=720]",
+    "480p": "best[height<=480]",
+    "360p": "best[height<=360]",
+}
+
 
 class YouTubeDownloadStrategy(BaseDownloadStrategy):
     """Strategy for YouTube downloads with CLI/API choice.
@@ -50,6 +67,10 @@ class YouTubeDownloadStrategy(BaseDownloadStrategy):
 
         # 🆕 New API client (lazy loaded only when needed)
         self._api_client: AsyncYtDlp | None = None
+        # Entered client reused across API calls, and the api_client it was entered from
+        self._entered_api_client: AsyncYtDlp | None = None
+        self._entered_from: AsyncYtDlp | None = None
+        self._api_client_lock = asyncio.Lock()
         logger.debug("YouTube strategy initialization complete")
 
     @property
@@ -138,6 +159,38 @@ class YouTubeDownloadStrategy(BaseDownloadStrategy):
         """Delete API client (for testing cleanup)."""
         self._api_client = None
 
+    async def _get_api_client(self) -> AsyncYtDlp:
+        """Return the API client, entering it on first use and reusing it afterwards.
+
+        The client is entered again only when ``api_client`` has been replaced (for
+        example after the download directory changes); the previous one is closed first.
+
+        Returns:
+            Entered AsyncYtDlp client
+        """
+        async with self._api_client_lock:
+            client = self.api_client
+            if self._entered_from is not client:
+                await self._close_entered_api_client()
+                logger.debug("Entering AsyncYtDlp API client")
+                self._entered_api_client = await client.__aenter__()
+                self._entered_from = client
+            return self._entered_api_client
+
+    async def _close_entered_api_client(self) -> None:
+        """Exit the entered API client, if any."""
+        entered_from = self._entered_from
+        self._entered_api_client = None
+        self._entered_from = None
+        if entered_from is not None:
+            logger.debug("Closing AsyncYtDlp API client")
+            await entered_from.__aexit__(None, None, None)
+
+    async def aclose(self) -> None:
+        """Close the API client kept open between downloads."""
+        async with self._api_client_lock:
+            await self._close_entered_api_client()
+
     @property
     def platform_name(self) -> str:
         """Get platform name for this strategy.
@@ -290,9 +343,9 @@ class YouTubeDownloadStrategy(BaseDownloadStrategy):
         logger.debug(f"Starting CLI download for URL: {url}")
         logger.debug(f"CLI download options: {kwargs}")
         # ✅ Call existing handler in executor to maintain async interface
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         logger.debug("Executing CLI handler in thread pool")
-        result = await loop.run_in_executor(None, self.cli_handler.download, url, **kwargs)
+        result = await loop.run_in_executor(None, functools.partial(self.cli_handler.download, url, **kwargs))
         logger.debug(f"CLI handler completed - success: {result.success}")
 
         # Convert DownloadResult to MediaMetadata
@@ -323,9 +376,9 @@ class YouTubeDownloadStrategy(BaseDownloadStrategy):
         """
         logger.debug(f"Getting metadata via CLI for URL: {url}")
         logger.debug(f"CLI metadata options: {kwargs}")
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         logger.debug("Executing CLI metadata extraction in thread pool")
-        result = await loop.run_in_executor(None, self.cli_handler.get_metadata, url, **kwargs)
+        result = await loop.run_in_executor(None, functools.partial(self.cli_handler.get_metadata, url, **kwargs))
         logger.debug(f"CLI metadata extraction complete - title: {result.title if result else 'None'}")
         return result
 
@@ -351,10 +404,10 @@ class YouTubeDownloadStrategy(BaseDownloadStrategy):
         Returns:
             MediaMetadata from API client
         """
-        async with self.api_client as client:
-            # Extract metadata and convert to MediaMetadata
-            async for item in client.extract_metadata(url):
-                return self._convert_api_response_to_metadata(item)
+        client = await self._get_api_client()
+        # Extract metadata and convert to MediaMetadata
+        async for item in client.extract_metadata(url):
+            return self._convert_api_response_to_metadata(item)
 
         # If no results, raise an error
         raise RuntimeError("No metadata results from YouTube API")
@@ -727,22 +780,9 @@ class YouTubeDownloadStrategy(BaseDownloadStrategy):
                 }
             )
         else:
-            if quality == "best":
-                download_options["format"] = "best"
-            elif quality == "worst":
-                download_options["format"] = "worst"
-            elif quality in ["4K", "2160p"]:
-                download_options["format"] = "best[height<=2160]"
-            elif quality in ["1440p", "2K"]:
-                download_options["format"] = "best[height<=1440]"
-            elif quality in ["1080p", "FHD"]:
-                download_options["format"] = "best[height<=1080]"
-            elif quality in ["720p", "HD"]:
-                download_options["format"] = "best[height<=720]"
-            elif quality in ["480p"]:
-                download_options["format"] = "best[height<=480]"
-            elif quality in ["360p"]:
-                download_options["format"] = "best[height<=360]"
+            quality_format = _QUALITY_FORMATS.get(quality)
+            if quality_format:
+                download_options["format"] = quality_format
 
         max_retries = 3
         retry_delay = 2.0
@@ -752,14 +792,14 @@ class YouTubeDownloadStrategy(BaseDownloadStrategy):
             logger.debug(f"Download attempt {attempt + 1}/{max_retries}")
             try:
                 logger.debug("Acquiring API client for download")
-                async with self.api_client as client:
-                    logger.debug(f"Starting download with options: {download_options}")
-                    # Download and convert API response to MediaMetadata
-                    async for item in client.download(url, **download_options):
-                        logger.debug("Download successful, converting response to metadata")
-                        result = self._convert_api_response_to_metadata(item)
-                        logger.debug(f"Metadata conversion complete - title: {result.title}")
-                        return result
+                client = await self._get_api_client()
+                logger.debug(f"Starting download with options: {download_options}")
+                # Download and convert API response to MediaMetadata
+                async for item in client.download(url, **download_options):
+                    logger.debug("Download successful, converting response to metadata")
+                    result = self._convert_api_response_to_metadata(item)
+                    logger.debug(f"Metadata conversion complete - title: {result.title}")
+                    return result
 
                 # If no results, raise an error
                 logger.error("No download results from YouTube API")
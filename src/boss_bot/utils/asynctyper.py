@@ -5,13 +5,10 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import logging
-from collections.abc import Awaitable, Callable, Coroutine, Iterable, Sequence
+from collections.abc import Callable
 from functools import partial, wraps
-from typing import Any, Dict, List, Optional, ParamSpec, Set, Tuple, Type, TypeVar, Union, cast
+from typing import Any, ParamSpec, TypeVar, cast
 
-import typer
-from rich.pretty import pprint
 from typer import Typer
 from typer.core import TyperCommand, TyperGroup
 from typer.models import CommandFunctionType
@@ -8,8 +8,18 @@ import pytest
 import typer
 from typer.testing import CliRunner
 
-from boss_bot.cli.commands.download import app, validate_twitter_url
+from boss_bot.cli.commands.download import (
+    _gather_bounded,
+    _get_strategy,
+    app,
+    get_strategy_for_platform,
+    validate_instagram_url,
+    validate_reddit_url,
+    validate_twitter_url,
+    validate_youtube_url,
+)
 from boss_bot.core.downloads.handlers.base_handler import DownloadResult, MediaMetadata
+from boss_bot.core.downloads.strategies import BaseDownloadStrategy
 
 
 def strip_ansi_codes(text: str) -> str:
@@ -18,6 +28,44 @@ def strip_ansi_codes(text: str) -> str:
     return ansi_escape.sub('', text)
 
 
+class _RecordingStrategy(BaseDownloadStrategy):
+    """Minimal real strategy that records whether the command closed it."""
+
+    platform_name = "youtube"
+
+    def __init__(self, download_dir: Path):
+        super().__init__(download_dir)
+        self.closed = False
+
+    async def download(self, url: str, **kwargs) -> MediaMetadata:
+        return MediaMetadata(title="Test Video", platform="youtube", files=["video.mp4"])
+
+    async def get_metadata(self, url: str, **kwargs) -> MediaMetadata:
+        return MediaMetadata(title="Test Video", platform="youtube")
+
+    def supports_url(self, url: str) -> bool:
+        return True
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _StreamingStrategy(_RecordingStrategy):
+    """Strategy that streams files, then optionally fails with the given error."""
+
+    def __init__(self, download_dir: Path, error: Exception | None = None):
+        super().__init__(download_dir)
+        self.error = error
+        self.calls = 0
+
+    async def download_iter(self, url: str, **kwargs):
+        self.calls += 1
+        yield "first.jpg", MediaMetadata(platform="youtube", files=["first.jpg"], download_method="api")
+        if self.error is not None:
+            raise self.error
+        yield "second.jpg", MediaMetadata(platform="youtube", files=["first.jpg", "second.jpg"], download_method="api")
+
+
 class TestDownloadCommands:
     """Test download CLI commands using strategy pattern."""
 
@@ -290,3 +338,146 @@ class TestDownloadCommands:
         assert "Download completed successfully" in clean_stdout
         # Check that custom directory was created
         assert custom_dir.exists()
+
+    def test_twitter_command_verbose_large_raw_metadata_written_to_file(self, runner, mocker, tmp_path):
+        """Test that oversized raw metadata is written to a temp file instead of printed."""
+        mock_strategy = mocker.Mock()
+        mock_strategy.supports_url.return_value = True
+
+        mock_metadata = MediaMetadata(
+            title="Test Tweet",
+            platform="twitter",
+            raw_metadata={"entries": ["x" * 100 for _ in range(1000)]},
+        )
+        mock_strategy.get_metadata = mocker.AsyncMock(return_value=mock_metadata)
+
+        mocker.patch('boss_bot.cli.commands.download.get_ai_enhanced_strategy', return_value=(mock_strategy, None))
+        mocker.patch('boss_bot.cli.commands.download.tempfile.tempdir', str(tmp_path))
+
+        result = runner.invoke(app, [
+            "twitter",
+            "https://twitter.com/bossjones/status/1818781891249815783",
+            "--metadata-only",
+            "--verbose"
+        ])
+
+        assert result.exit_code == 0
+        clean_stdout = strip_ansi_codes(result.stdout)
+        assert "Raw metadata" in clean_stdout
+        assert "written to" in clean_stdout
+        dumped = list(tmp_path.glob("boss-bot-metadata-*.json"))
+        assert len(dumped) == 1
+        assert "entries" in dumped[0].read_text()
+
+    def test_download_command_closes_strategy(self, runner, mocker, tmp_path):
+        """Test that the strategy's open clients are closed when the command finishes."""
+        strategy = _RecordingStrategy(tmp_path)
+        mocker.patch('boss_bot.cli.commands.download.get_strategy_for_platform', return_value=strategy)
+
+        result = runner.invoke(app, ["youtube", "https://www.youtube.com/watch?v=dQw4w9WgXcQ", "-o", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert strategy.closed
+
+    def test_download_command_prints_streamed_files(self, runner, mocker, tmp_path):
+        """Test that files from a streaming strategy are printed as they arrive."""
+        strategy = _StreamingStrategy(tmp_path)
+        mocker.patch('boss_bot.cli.commands.download.get_strategy_for_platform', return_value=strategy)
+
+        result = runner.invoke(app, ["youtube", "https://www.youtube.com/watch?v=dQw4w9WgXcQ", "-o", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert result.stdout.count("📄 first.jpg") == 1
+        assert result.stdout.count("📄 second.jpg") == 1
+        assert "Downloaded 2 files" in result.stdout
+        assert "Downloaded using API method" in result.stdout
+
+    def test_download_command_does_not_retry_after_streamed_files(self, runner, mocker, tmp_path):
+        """Test that a rate limit hit mid-stream fails instead of re-printing the streamed files."""
+        strategy = _StreamingStrategy(tmp_path, error=RuntimeError("HTTP Error 429: Too Many Requests"))
+        mocker.patch('boss_bot.cli.commands.download.get_strategy_for_platform', return_value=strategy)
+
+        result = runner.invoke(app, ["youtube", "https://www.youtube.com/watch?v=dQw4w9WgXcQ", "-o", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert strategy.calls == 1
+        assert "Rate limited, retrying" not in result.stdout
+        assert result.stdout.count("📄 first.jpg") == 1
+        assert "Download failed: HTTP Error 429" in result.stdout
+
+    def test_get_strategy_for_platform_reuses_instances(self, mocker, tmp_path):
+        """Test that strategies are built once per platform and download directory."""
+        _get_strategy.cache_clear()
+        mocker.patch('boss_bot.cli.commands.download.get_feature_flags', return_value=mocker.Mock())
+
+        first = get_strategy_for_platform("twitter", tmp_path)
+
+        assert get_strategy_for_platform("twitter", tmp_path) is first
+        assert get_strategy_for_platform("reddit", tmp_path) is not first
+        assert get_strategy_for_platform("myspace", tmp_path) is None
+        _get_strategy.cache_clear()
+
+    @pytest.mark.parametrize(
+        "validator,url",
+        [
+            (validate_twitter_url, "https://x.com/username/status/123456789"),
+            (validate_twitter_url, "https://twitter.com/username"),
+            (validate_reddit_url, "https://old.reddit.com/r/test/comments/abc123/title/"),
+            (validate_instagram_url, "https://www.instagram.com/reel/ABC123/"),
+            (validate_youtube_url, "https://youtu.be/VIDEO_ID"),
+            (validate_youtube_url, "https://music.youtube.com/watch?v=VIDEO_ID"),
+        ],
+    )
+    def test_validate_url_accepts_supported_formats(self, validator, url):
+        """Test that URL validators accept each platform's supported formats."""
+        assert validator(url) == url
+
+    @pytest.mark.parametrize(
+        "validator,url",
+        [
+            (validate_twitter_url, "https://x.com/username/likes"),
+            (validate_reddit_url, "https://reddit.com/r/test/"),
+            (validate_youtube_url, "https://youtube.com/watch"),
+        ],
+    )
+    def test_validate_url_rejects_unsupported_formats(self, validator, url):
+        """Test that URL validators raise BadParameter for unsupported URLs."""
+        with pytest.raises(typer.BadParameter, match="Supported formats"):
+            validator(url)
+
+    def test_twitter_command_metadata_only_deduplicates_urls(self, runner, mocker):
+        """Test that a URL repeated in one invocation is only looked up once."""
+        mock_strategy = mocker.Mock()
+        mock_strategy.get_metadata = mocker.AsyncMock(
+            return_value=MediaMetadata(title="Test Tweet", platform="twitter")
+        )
+
+        mocker.patch(
+            'boss_bot.cli.commands.download.get_ai_enhanced_strategy',
+            new=mocker.AsyncMock(return_value=(mock_strategy, None)),
+        )
+
+        url = "https://twitter.com/user/status/123456789"
+        result = runner.invoke(app, ["twitter", url, url, "--metadata-only"])
+
+        assert result.exit_code == 0
+        mock_strategy.get_metadata.assert_awaited_once_with(url)
+
+    def test_gather_bounded_interleaves_hosts_and_keeps_order(self):
+        """Test that batches start round-robin across hosts but return results in input order."""
+        urls = [
+            "https://reddit.com/r/a/comments/1/",
+            "https://reddit.com/r/a/comments/2/",
+            "https://x.com/user/status/1",
+            "https://reddit.com/r/a/comments/3/",
+        ]
+        started = []
+
+        async def record(url):
+            started.append(url)
+            return url.upper()
+
+        results = asyncio.run(_gather_bounded(record, urls, concurrency=1))
+
+        assert results == [url.upper() for url in urls]
+        assert started == [urls[0], urls[2], urls[1], urls[3]]
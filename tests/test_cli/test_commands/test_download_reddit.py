@@ -295,3 +295,133 @@ class TestRedditCommands:
         assert "--async" in clean_stdout
         assert "--config" in clean_stdout
         assert "--cookies" in clean_stdout
+
+    def test_reddit_command_multiple_urls(self, runner, mocker):
+        """Test Reddit command downloads several URLs and reports each one."""
+        mock_strategy = mocker.Mock()
+        mock_strategy.supports_url.return_value = True
+
+        async def mock_download(url, **kwargs):
+            if "bad" in url:
+                return MediaMetadata(platform="reddit", error="Network error")
+            return MediaMetadata(title="Test Reddit Post", platform="reddit", files=[f"{url[-4:-1]}.jpg"])
+
+        mock_strategy.download = mocker.AsyncMock(side_effect=mock_download)
+
+        mocker.patch('boss_bot.cli.commands.download.get_strategy_for_platform', return_value=mock_strategy)
+
+        result = runner.invoke(app, [
+            "reddit",
+            "https://reddit.com/r/test/comments/abc123/one/",
+            "https://reddit.com/r/test/comments/def456/bad/",
+            "https://reddit.com/r/test/comments/ghi789/two/",
+        ])
+
+        assert result.exit_code == 1
+        clean_stdout = strip_ansi_codes(result.stdout)
+        assert clean_stdout.count("Download completed successfully") == 2
+        assert "Download failed: Network error" in clean_stdout
+        assert "2/3 URLs completed successfully" in clean_stdout
+        assert mock_strategy.download.call_count == 3
+
+    def test_reddit_command_metadata_only_skips_output_dir(self, runner, mocker, tmp_path):
+        """Test that --metadata-only does not create the output directory."""
+        mock_strategy = mocker.Mock()
+        mock_strategy.supports_url.return_value = True
+        mock_strategy.get_metadata = mocker.AsyncMock(
+            return_value=MediaMetadata(title="Test Reddit Post", platform="reddit")
+        )
+
+        mocker.patch('boss_bot.cli.commands.download.get_strategy_for_platform', return_value=mock_strategy)
+
+        output_dir = tmp_path / "never_created"
+        result = runner.invoke(app, [
+            "reddit",
+            "https://reddit.com/r/test/comments/abc123/title/",
+            "--metadata-only",
+            "--output-dir", str(output_dir)
+        ])
+
+        assert result.exit_code == 0
+        assert not output_dir.exists()
+
+    def test_reddit_command_concurrency_limit(self, runner, mocker):
+        """Test that --concurrency caps the number of URLs processed at once."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_download(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MediaMetadata(title="Test Reddit Post", platform="reddit", files=["file.jpg"])
+
+        mock_strategy = mocker.Mock()
+        mock_strategy.supports_url.return_value = True
+        mock_strategy.download = mocker.AsyncMock(side_effect=mock_download)
+
+        mocker.patch('boss_bot.cli.commands.download.get_strategy_for_platform', return_value=mock_strategy)
+
+        result = runner.invoke(app, [
+            "reddit",
+            *[f"https://reddit.com/r/test/comments/abc12{i}/title/" for i in range(4)],
+            "--concurrency", "2",
+        ])
+
+        assert result.exit_code == 0
+        assert mock_strategy.download.call_count == 4
+        assert peak == 2
+
+    def test_reddit_command_with_metadata(self, runner, mocker):
+        """Test that --with-metadata fetches metadata alongside the download."""
+        mock_strategy = mocker.Mock()
+        mock_strategy.supports_url.return_value = True
+        mock_strategy.get_metadata = mocker.AsyncMock(
+            return_value=MediaMetadata(title="Test Reddit Post", platform="reddit", uploader="test_user")
+        )
+        mock_strategy.download = mocker.AsyncMock(
+            return_value=MediaMetadata(title="Test Reddit Post", platform="reddit", files=["file.jpg"])
+        )
+
+        mocker.patch('boss_bot.cli.commands.download.get_strategy_for_platform', return_value=mock_strategy)
+
+        result = runner.invoke(app, [
+            "reddit",
+            "https://reddit.com/r/test/comments/abc123/title/",
+            "--with-metadata",
+        ])
+
+        assert result.exit_code == 0
+        clean_stdout = strip_ansi_codes(result.stdout)
+        assert "test_user" in clean_stdout
+        assert "Download completed successfully" in clean_stdout
+        mock_strategy.get_metadata.assert_awaited_once()
+        mock_strategy.download.assert_awaited_once()
+
+    def test_reddit_command_retries_rate_limited_download(self, runner, mocker):
+        """Test that a rate-limited download is retried instead of failing the URL."""
+        mocker.patch('boss_bot.cli.commands.download._MAX_BACKOFF_SECONDS', 0)
+        mock_strategy = mocker.Mock()
+        mock_strategy.supports_url.return_value = True
+        mock_strategy.download = mocker.AsyncMock(
+            side_effect=[
+                MediaMetadata(platform="reddit", error="HTTP Error 429: Too Many Requests"),
+                MediaMetadata(title="Test Reddit Post", platform="reddit", files=["file.jpg"]),
+            ]
+        )
+
+        mocker.patch('boss_bot.cli.commands.download.get_strategy_for_platform', return_value=mock_strategy)
+
+        result = runner.invoke(app, [
+            "reddit",
+            "https://reddit.com/r/test/comments/abc123/title/",
+            "--retries", "1",
+        ])
+
+        assert result.exit_code == 0
+        clean_stdout = strip_ansi_codes(result.stdout)
+        assert "Rate limited, retrying" in clean_stdout
+        assert "Download completed successfully" in clean_stdout
+        assert mock_strategy.download.call_count == 2
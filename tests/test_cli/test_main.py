@@ -0,0 +1,164 @@
+"""Tests for the bossctl root command group."""
+
+import asyncio
+import importlib
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from boss_bot.cli.main import (
+    APP,
+    LAZY_SUBCOMMANDS,
+    _detect_platform_from_url,
+    _determine_download_tool,
+    _download_urls_async,
+    _mask_sensitive_config,
+    load_commands,
+)
+
+# boss_bot.cli re-exports the main() function under the submodule's name, so fetch the module itself
+cli_main = importlib.import_module("boss_bot.cli.main")
+
+
+class TestLazySubcommands:
+    """Test cases for lazily loaded subcommand modules."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    def test_load_commands_registers_without_importing(self, tmp_path, monkeypatch):
+        """Test that load_commands records subcommand modules without importing them."""
+        subcommands_dir = tmp_path / "subcommands"
+        subcommands_dir.mkdir()
+        (subcommands_dir / "lazy_cmd.py").write_text("raise RuntimeError('imported eagerly')\n")
+        monkeypatch.setattr(cli_main, "__file__", str(tmp_path / "main.py"))
+        monkeypatch.setattr(cli_main, "LAZY_SUBCOMMANDS", LAZY_SUBCOMMANDS.copy())
+
+        load_commands()
+
+        assert cli_main.LAZY_SUBCOMMANDS["lazy"] == "boss_bot.cli.subcommands.lazy_cmd"
+        assert "boss_bot.cli.subcommands.lazy_cmd" not in sys.modules
+
+    def test_lazy_subcommand_imported_on_invoke(self, monkeypatch):
+        """Test that a registered subcommand is imported and run when invoked."""
+        monkeypatch.setitem(LAZY_SUBCOMMANDS, "lazy-download", "boss_bot.cli.commands.download")
+
+        result = self.runner.invoke(APP, ["lazy-download", "--help"])
+
+        assert result.exit_code == 0
+        assert "twitter" in result.stdout
+
+    def test_builtin_command_groups_are_lazy(self):
+        """Test that the download and assistants groups are registered lazily and still run."""
+        assert LAZY_SUBCOMMANDS["download"] == "boss_bot.cli.commands.download"
+        assert LAZY_SUBCOMMANDS["assistants"] == "boss_bot.cli.commands.assistants"
+
+        result = self.runner.invoke(APP, ["download", "--help"])
+
+        assert result.exit_code == 0
+        assert "reddit" in result.stdout
+
+
+class TestMain:
+    """Test cases for the console script entry point."""
+
+    def test_version_fast_path_skips_typer(self, monkeypatch, capsys, mocker):
+        """Test that a bare version command prints without dispatching through the app."""
+        mock_app = mocker.patch.object(cli_main, "APP")
+        monkeypatch.setattr(sys, "argv", ["bossctl", "version"])
+
+        cli_main.main()
+
+        assert capsys.readouterr().out == f"boss_bot version: {cli_main.__version__}\n"
+        mock_app.assert_not_called()
+
+
+class TestUrlClassification:
+    """Test cases for URL-based tool and platform detection."""
+
+    @pytest.mark.parametrize(
+        "url,tool,host",
+        [
+            ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "yt-dlp", "youtube.com"),
+            ("https://vm.tiktok.com/abc/", "yt-dlp", "tiktok.com"),
+            ("https://x.com/user/status/1", "gallery-dl", "x.com"),
+            ("https://old.reddit.com/r/pics/", "gallery-dl", "reddit.com"),
+        ],
+    )
+    def test_determine_download_tool(self, url, tool, host):
+        """Test that known hosts pick the right tool and name the host in the reason."""
+        kind = "Video" if tool == "yt-dlp" else "Gallery"
+        assert _determine_download_tool(url) == (tool, f"{kind} platform detected ({host})")
+
+    def test_determine_download_tool_unknown_host(self):
+        """Test that unknown hosts default to yt-dlp."""
+        assert _determine_download_tool("https://example.org/video")[0] == "yt-dlp"
+
+    @pytest.mark.parametrize(
+        "url,platform",
+        [
+            ("https://twitter.com/user", "twitter"),
+            ("https://youtu.be/abc", "youtube"),
+            ("https://www.pixiv.net/artworks/1", "pixiv"),
+            ("https://example.org/", None),
+        ],
+    )
+    def test_detect_platform_from_url(self, url, platform):
+        """Test that the platform is named after the matching host."""
+        assert _detect_platform_from_url(url) == platform
+
+
+class TestMaskSensitiveConfig:
+    """Test cases for masking secrets in displayed config files."""
+
+    def test_masks_sensitive_keys_case_insensitively(self):
+        """Test that sensitive keys are masked at any depth and regardless of case."""
+        config = {
+            "extractor": {
+                "twitter": {"Username": "me", "PASSWORD": "hunter2", "videos": True},
+                "postprocessors": [{"name": "metadata", "api_key": "abc"}],
+            },
+            "base-directory": "./downloads",
+        }
+
+        assert _mask_sensitive_config(config) == {
+            "extractor": {
+                "twitter": {"Username": "<MASKED>", "PASSWORD": "<MASKED>", "videos": True},
+                "postprocessors": [{"name": "metadata", "api_key": "<MASKED>"}],
+            },
+            "base-directory": "./downloads",
+        }
+
+
+class TestDownloadUrlsAsync:
+    """Test cases for the fetch command's download loop."""
+
+    async def test_downloads_run_concurrently_up_to_setting(self, tmp_path, mocker):
+        """Test that URLs download in parallel, capped by max_concurrent_downloads."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_download(client, url, output_dir, verbose):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return not url.endswith("3")
+
+        mock_client = mocker.AsyncMock()
+        mock_client.__aenter__.return_value = mock_client
+        mocker.patch("boss_bot.core.downloads.clients.aio_yt_dlp.AsyncYtDlp", return_value=mock_client)
+        mocker.patch.object(cli_main, "_download_with_ytdlp_api", side_effect=mock_download)
+        mocker.patch.object(cli_main, "get_settings", return_value=mocker.Mock(max_concurrent_downloads=2))
+        mock_cprint = mocker.patch.object(cli_main, "cprint")
+
+        urls = [f"https://www.youtube.com/watch?v={i}" for i in range(4)]
+        await _download_urls_async(urls, tmp_path, verbose=False, dry_run=False)
+
+        assert peak == 2
+        printed = [str(call.args[0]) for call in mock_cprint.call_args_list if call.args]
+        assert any("Successful: 3" in line for line in printed)
+        assert any("Failed: 1" in line for line in printed)
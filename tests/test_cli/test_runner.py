@@ -0,0 +1,35 @@
+"""Tests for CLI event loop helpers."""
+
+import asyncio
+
+from boss_bot.cli.utils import runner
+
+
+class TestRunner:
+    """Test the uvloop-aware asyncio runner."""
+
+    def test_run_returns_coroutine_result(self):
+        """Test that run drives a coroutine to completion."""
+
+        async def compute():
+            await asyncio.sleep(0)
+            return 42
+
+        assert runner.run(compute()) == 42
+
+    def test_loop_factory_falls_back_to_default_loop(self, mocker):
+        """Test that the default asyncio loop is used when uvloop is unavailable."""
+        mocker.patch.object(runner, "UVLOOP_AVAILABLE", False)
+
+        assert runner.loop_factory() is None
+
+    def test_run_reuses_event_loop(self):
+        """Test that sequential runs share the same event loop."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = runner.run(current_loop())
+
+        assert runner.run(current_loop()) is first
+        assert not first.is_closed()
@@ -1,15 +1,28 @@
 """Tests for AsyncGalleryDL client with VCR recording."""
 
+import asyncio
+import copy
 import json
+import threading
+import time
 import pytest
 from pathlib import Path
 from typing import Dict, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from boss_bot.core.downloads.clients import AsyncGalleryDL
+from boss_bot.core.downloads.clients import aio_gallery_dl
+from boss_bot.core.downloads.clients.aio_gallery_dl import _AdaptiveLimit, _ConfigGate
 from boss_bot.core.downloads.clients.config import GalleryDLConfig
 
 
+@pytest.fixture(autouse=True)
+def reset_gallery_dl_state(monkeypatch):
+    """Start every test without gallery-dl configuration loaded or applied by an earlier one."""
+    monkeypatch.setattr(aio_gallery_dl, "_LOADED_CONFIG_CACHE", {})
+    monkeypatch.setattr(aio_gallery_dl, "_CONFIG_GATE", _ConfigGate())
+
+
 class TestAsyncGalleryDL:
     """Test AsyncGalleryDL client functionality."""
 
@@ -108,8 +121,39 @@ class TestAsyncGalleryDL:
             executor = client._executor
             assert executor is not None
 
-        # Executor should be shut down after exit
-        assert executor._shutdown
+        # The client releases the shared executor on exit without shutting it down
+        assert client._executor is None
+        assert not executor._shutdown
+
+    @pytest.mark.asyncio
+    async def test_context_manager_executor_size(self, temp_download_dir):
+        """Test that the executor is sized from max_workers."""
+        client = AsyncGalleryDL(download_dir=temp_download_dir, max_workers=5)
+
+        async with client:
+            assert client._executor._max_workers == 5
+        assert "max_workers" not in client.config
+
+    @pytest.mark.asyncio
+    async def test_context_manager_reentrant(self, temp_download_dir):
+        """Test nested entries share one executor until the outermost exit."""
+        client = AsyncGalleryDL(download_dir=temp_download_dir)
+
+        async with client:
+            executor = client._executor
+            async with client:
+                assert client._executor is executor
+            assert client._executor is executor
+
+        assert client._executor is None
+
+    @pytest.mark.asyncio
+    async def test_clients_share_executor(self, temp_download_dir):
+        """Test that clients with the same pool size reuse one process-wide executor."""
+        async with AsyncGalleryDL(download_dir=temp_download_dir) as first:
+            executor = first._executor
+        async with AsyncGalleryDL(download_dir=temp_download_dir) as second:
+            assert second._executor is executor
 
     @pytest.mark.asyncio
     async def test_self_config_synchronization(self, temp_download_dir):
@@ -197,6 +241,28 @@ class TestAsyncGalleryDL:
             assert config["extractor"]["twitter"]["quoted"] is True
             assert config["downloader"]["retries"] == 3
 
+    @pytest.mark.asyncio
+    async def test_configuration_file_load_cached_until_changed(self, temp_download_dir, mock_config_dict, mocker):
+        """Test that an unchanged config file is not reloaded, and an edited one is."""
+        from gallery_dl import config as gdl_config
+
+        config_file = temp_download_dir / "gallery-dl.conf"
+        config_file.parent.mkdir(parents=True, exist_ok=True)
+        config_file.write_text(json.dumps(mock_config_dict))
+        load_spy = mocker.spy(gdl_config, "load")
+
+        for _ in range(2):
+            async with AsyncGalleryDL(config_file=config_file, download_dir=temp_download_dir) as client:
+                assert client.config["downloader"]["retries"] == 3
+        assert load_spy.call_count == 1
+
+        mock_config_dict["downloader"]["retries"] = 10
+        config_file.write_text(json.dumps(mock_config_dict))
+
+        async with AsyncGalleryDL(config_file=config_file, download_dir=temp_download_dir) as client:
+            assert client.config["downloader"]["retries"] == 10
+        assert load_spy.call_count == 2
+
     @pytest.mark.asyncio
     async def test_configuration_merging(self, temp_download_dir, mock_config_dict):
         """Test configuration merging priority and self.config synchronization."""
@@ -270,6 +336,26 @@ class TestAsyncGalleryDL:
         # In practice, gallery-dl would be a dependency and available
         pass
 
+    @pytest.mark.asyncio
+    async def test_adaptive_limit_backs_off_and_recovers(self):
+        """Test that throttling halves the concurrency limit and successes restore it."""
+        limit = _AdaptiveLimit(8)
+
+        with pytest.raises(RuntimeError):
+            async with limit:
+                raise RuntimeError("HttpError: '429 Too Many Requests' for 'https://x.com/...'")
+        assert limit.limit == 4
+
+        with pytest.raises(ValueError):
+            async with limit:
+                raise ValueError("No extractor found for URL")
+        assert limit.limit == 4
+
+        for _ in range(10):
+            async with limit:
+                pass
+        assert limit.limit == 8
+
     def test_repr(self, temp_download_dir):
         """Test string representation."""
         config_file = Path("~/.gallery-dl.conf").expanduser()
@@ -384,6 +470,96 @@ class TestAsyncGalleryDLWithMockedGalleryDL:
                 async for _ in client.extract_metadata("https://unsupported.com/test"):
                     pass
 
+    @pytest.mark.asyncio
+    async def test_extract_metadata_streams_items(self, mock_gallery_dl, temp_download_dir):
+        """Test that metadata items are yielded before the extractor has finished."""
+        first_received = threading.Event()
+
+        def messages():
+            yield ("url", {"title": "first"})
+            # Only continue once the consumer has seen the first item
+            assert first_received.wait(timeout=5)
+            yield ("url", {"title": "second"})
+
+        mock_gallery_dl.extractor.find.return_value = messages()
+
+        client = AsyncGalleryDL(download_dir=temp_download_dir)
+
+        async with client:
+            titles = []
+            async for metadata in client.extract_metadata("https://twitter.com/test"):
+                titles.append(metadata["title"])
+                first_received.set()
+
+        assert titles == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_downloads_keep_their_own_options(self, mock_gallery_dl, temp_download_dir):
+        """Test that overlapping downloads with different options each run with their own config."""
+        global_config: dict[str, Any] = {}
+        mock_gallery_dl.config._config = global_config
+        mock_gallery_dl.config.clear.side_effect = global_config.clear
+        mock_gallery_dl.util.combine_dict.side_effect = lambda a, b: a.update(copy.deepcopy(b))
+        seen = []
+
+        def make_job(url):
+            def run():
+                before = global_config["extractor"]["videos"]
+                time.sleep(0.05)  # Give the other download time to start
+                seen.append((url, before, global_config["extractor"]["videos"]))
+
+            return MagicMock(run=MagicMock(side_effect=run))
+
+        mock_gallery_dl.job.DownloadJob.side_effect = make_job
+
+        client = AsyncGalleryDL(download_dir=temp_download_dir)
+
+        async def download(url, videos):
+            return [item async for item in client.download(url, videos=videos)]
+
+        async with client:
+            await asyncio.gather(download("https://twitter.com/a", True), download("https://twitter.com/b", False))
+
+        assert sorted(seen) == [("https://twitter.com/a", True, True), ("https://twitter.com/b", False, False)]
+        assert "videos" not in client.config.get("extractor", {})
+
+    @pytest.mark.asyncio
+    async def test_metadata_and_download_with_same_options_overlap(self, mock_gallery_dl, temp_download_dir):
+        """Test that a metadata lookup and a download with the same options run together on one config."""
+        global_config: dict[str, Any] = {}
+        mock_gallery_dl.config._config = global_config
+        mock_gallery_dl.config.clear.side_effect = global_config.clear
+        mock_gallery_dl.util.combine_dict.side_effect = lambda a, b: a.update(copy.deepcopy(b))
+        # Both calls must be inside gallery-dl at the same time to get past the barrier
+        both_running = threading.Barrier(2, timeout=5)
+        seen = []
+
+        def messages():
+            both_running.wait()
+            seen.append(global_config["extractor"]["videos"])
+            yield ("url", {"title": "Test Tweet"})
+
+        def run():
+            both_running.wait()
+            seen.append(global_config["extractor"]["videos"])
+
+        mock_gallery_dl.extractor.find.return_value = messages()
+        mock_gallery_dl.job.DownloadJob.return_value = MagicMock(run=MagicMock(side_effect=run))
+
+        client = AsyncGalleryDL(download_dir=temp_download_dir)
+
+        async def lookup():
+            return [item async for item in client.extract_metadata("https://twitter.com/test", videos=True)]
+
+        async def download():
+            return [item async for item in client.download("https://twitter.com/test", videos=True)]
+
+        async with client:
+            metadata, _ = await asyncio.gather(lookup(), download())
+
+        assert metadata == [{"title": "Test Tweet"}]
+        assert seen == [True, True]
+
     @pytest.mark.asyncio
     async def test_download_success(self, mock_gallery_dl, temp_download_dir):
         """Test successful download operation."""
@@ -0,0 +1,68 @@
+"""Tests for AsyncYtDlp client."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from boss_bot.core.downloads.clients import AsyncYtDlp
+
+
+class TestAsyncYtDlp:
+    """Test AsyncYtDlp client functionality."""
+
+    @pytest.fixture
+    def mock_yt_dlp(self):
+        """Mock yt-dlp module whose YoutubeDL instances record the params they were built with."""
+        yt_dlp_mock = MagicMock()
+
+        def make_instance(params):
+            instance = MagicMock()
+            instance.params = params
+
+            def extract_info(url, download=True):
+                return {"title": url, "format": instance.params.get("format")}
+
+            instance.extract_info.side_effect = extract_info
+            return instance
+
+        yt_dlp_mock.YoutubeDL.side_effect = make_instance
+
+        with patch.dict("sys.modules", {"yt_dlp": yt_dlp_mock}):
+            yield yt_dlp_mock
+
+    @pytest.mark.asyncio
+    async def test_download_options_do_not_change_shared_params(self, mock_yt_dlp, tmp_path):
+        """Test that overlapping downloads with different options each use their own format."""
+        async with AsyncYtDlp(output_dir=tmp_path) as client:
+            default_format = client._yt_dlp.params["format"]
+
+            async def download(url, **options):
+                return [item async for item in client.download(url, **options)]
+
+            audio, video, plain = await asyncio.gather(
+                download("https://youtu.be/a", format="bestaudio"),
+                download("https://youtu.be/b", format="best[height<=1080]"),
+                download("https://youtu.be/c"),
+            )
+
+            assert audio[0]["info"]["format"] == "bestaudio"
+            assert video[0]["info"]["format"] == "best[height<=1080]"
+            assert plain[0]["info"]["format"] == default_format
+            assert client._yt_dlp.params["format"] == default_format
+
+            # Repeated option sets reuse their YoutubeDL instead of building a new one
+            await download("https://youtu.be/d", format="bestaudio")
+            assert mock_yt_dlp.YoutubeDL.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_exit_closes_every_instance(self, mock_yt_dlp, tmp_path):
+        """Test that leaving the context closes the shared and per-option YoutubeDL instances."""
+        async with AsyncYtDlp(output_dir=tmp_path) as client:
+            shared = client._yt_dlp
+            async for _ in client.download("https://youtu.be/a", format="bestaudio"):
+                pass
+            per_options = next(iter(client._yt_dlp_by_options.values()))
+
+        shared.close.assert_called_once()
+        per_options.close.assert_called_once()
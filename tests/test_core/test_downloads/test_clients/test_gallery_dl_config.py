@@ -279,3 +279,17 @@ class TestGalleryDLConfig:
         # Compare key sections
         assert dict1["extractor"]["base-directory"] == dict2["extractor"]["base-directory"]
         assert dict1["output"]["mode"] == dict2["output"]["mode"]
+
+    def test_deep_merge_does_not_modify_inputs(self):
+        """Test that _deep_merge merges nested dicts without touching either input."""
+        base = {"extractor": {"twitter": {"quoted": True, "videos": True}, "base-directory": "./downloads/"}}
+        override = {"extractor": {"twitter": {"quoted": False}}, "downloader": {"retries": 5}}
+
+        merged = GalleryDLConfig()._deep_merge(base, override)
+
+        assert merged == {
+            "extractor": {"twitter": {"quoted": False, "videos": True}, "base-directory": "./downloads/"},
+            "downloader": {"retries": 5},
+        }
+        assert base == {"extractor": {"twitter": {"quoted": True, "videos": True}, "base-directory": "./downloads/"}}
+        assert override == {"extractor": {"twitter": {"quoted": False}}, "downloader": {"retries": 5}}
@@ -141,6 +141,20 @@ class TestTwitterDownloadStrategyCLIMode:
         assert result.files == ["test_tweet.jpg"]
         strategy.cli_handler.download.assert_called_once_with(url)
 
+    @pytest.mark.asyncio
+    async def test_download_iter_default_yields_files(
+        self, strategy: TwitterDownloadStrategy, mocker: MockerFixture
+    ) -> None:
+        """Test default download_iter falls back to download() and yields each file."""
+        url = "https://twitter.com/test/status/123"
+        final_metadata = MediaMetadata(url=url, platform="twitter", files=["a.jpg", "b.mp4"])
+        mocker.patch.object(strategy, "download", mocker.AsyncMock(return_value=final_metadata))
+
+        items = [item async for item in strategy.download_iter(url)]
+
+        assert items == [("a.jpg", final_metadata), ("b.mp4", final_metadata)]
+        strategy.download.assert_called_once_with(url)
+
     @pytest.mark.asyncio
     async def test_get_metadata_cli_mode(self, strategy: TwitterDownloadStrategy, mocker: MockerFixture) -> None:
         """Test metadata extraction in CLI mode."""
@@ -303,6 +317,33 @@ class TestTwitterDownloadStrategyAPIMode:
         with pytest.raises(RuntimeError, match="No content downloaded from"):
             await strategy.download(url)
 
+    @pytest.mark.asyncio
+    async def test_download_iter_api_mode_streams_files(
+        self, strategy: TwitterDownloadStrategy, temp_download_dir: Path, mocker: MockerFixture
+    ) -> None:
+        """Test download_iter yields each saved file as the API client reports it."""
+        url = "https://x.com/test/status/123"
+        first, second = str(temp_download_dir / "a.jpg"), str(temp_download_dir / "b.mp4")
+
+        mock_client = mocker.AsyncMock()
+
+        async def mock_download_generator(url: str, **kwargs: Any) -> AsyncGenerator[dict[str, Any], None]:
+            for path in (first, second):
+                yield {"title": "Mock Tweet", "filename": Path(path).name, "path": path}
+            yield {"title": "Mock Tweet", "filename": "skipped.jpg"}
+
+        mock_client.download = mock_download_generator
+        mock_client.__aenter__ = mocker.AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = mocker.AsyncMock(return_value=None)
+        mocker.patch.object(strategy, 'api_client', mock_client)
+
+        items = [item async for item in strategy.download_iter(url)]
+
+        assert [path for path, _ in items] == [first, second]
+        assert items[0][1].files == [first]
+        assert items[-1][1].files == [first, second]
+        assert items[-1][1].download_method == "api"
+
     @pytest.mark.asyncio
     async def test_get_metadata_api_mode_no_results(self, strategy: TwitterDownloadStrategy, mocker: MockerFixture) -> None:
         """Test metadata extraction in API mode with no results."""
@@ -8,7 +8,7 @@ from pytest_mock import MockerFixture
 from unittest.mock import Mock
 
 from boss_bot.core.downloads.feature_flags import DownloadFeatureFlags
-from boss_bot.core.downloads.handlers.base_handler import MediaMetadata
+from boss_bot.core.downloads.handlers.base_handler import DownloadResult, MediaMetadata
 from boss_bot.core.downloads.strategies.youtube_strategy import YouTubeDownloadStrategy
 
 
@@ -418,6 +418,59 @@ class TestYouTubeDownloadStrategy:
         with pytest.raises(RuntimeError, match="No metadata results"):
             await strategy._get_metadata_via_api("https://www.youtube.com/watch?v=test")
 
+    @pytest.mark.asyncio
+    async def test_download_via_cli_passes_options(
+        self,
+        fixture_youtube_strategy_test: YouTubeDownloadStrategy,
+        mocker: MockerFixture
+    ):
+        """Test that download options reach the CLI handler."""
+        strategy = fixture_youtube_strategy_test
+        expected_metadata = MediaMetadata(platform="youtube", url="test-url", title="Test Video")
+        mock_handler_download = mocker.patch.object(
+            strategy.cli_handler, 'download',
+            return_value=DownloadResult(success=True, metadata=expected_metadata)
+        )
+
+        result = await strategy._download_via_cli(
+            "https://www.youtube.com/watch?v=test", quality="1080p", audio_only=True
+        )
+
+        mock_handler_download.assert_called_once_with(
+            "https://www.youtube.com/watch?v=test", quality="1080p", audio_only=True
+        )
+        assert result == expected_metadata
+
+    @pytest.mark.asyncio
+    async def test_api_client_entered_once_and_closed(
+        self,
+        fixture_youtube_strategy_test: YouTubeDownloadStrategy,
+        mocker: MockerFixture
+    ):
+        """Test that the API client is entered once, reused across calls and closed by aclose."""
+        strategy = fixture_youtube_strategy_test
+
+        async def metadata_generator(url):
+            yield {"title": "Test Video", "url": url}
+
+        mock_client_context = mocker.AsyncMock()
+        mock_client_context.extract_metadata = mocker.Mock(side_effect=metadata_generator)
+
+        mock_api_client = mocker.AsyncMock()
+        mock_api_client.__aenter__ = mocker.AsyncMock(return_value=mock_client_context)
+        mock_api_client.__aexit__ = mocker.AsyncMock(return_value=None)
+        mocker.patch.object(strategy, 'api_client', mock_api_client)
+
+        await strategy._get_metadata_via_api("https://www.youtube.com/watch?v=one")
+        await strategy._get_metadata_via_api("https://www.youtube.com/watch?v=two")
+
+        mock_api_client.__aenter__.assert_awaited_once()
+        mock_api_client.__aexit__.assert_not_awaited()
+
+        await strategy.aclose()
+
+        mock_api_client.__aexit__.assert_awaited_once()
+
 
 class TestYouTubeDownloadStrategyQualitySelection:
     """Test suite for YouTube quality selection features."""